@@ -12,6 +12,20 @@ from ..profile_schema import UserProfile
 
 logger = logging.getLogger(__name__)
 
+# Aggregated data sources; consolidation needs at least one non-empty
+_DATA_KEYS = (
+    "resume",
+    "photos",
+    "voice_notes",
+    "chat_transcripts",
+    "calendar_events",
+    "emails",
+    "social_posts",
+    "blog_posts",
+    "screenshots",
+    "shared_images",
+)
+
 
 class BaseConsolidationStrategy:
     """Base implementation for consolidation strategies with common functionality."""
@@ -49,21 +63,7 @@ class BaseConsolidationStrategy:
     @staticmethod
     def _has_data(raw_data: Dict[str, Any]) -> bool:
         """Check if raw data contains any information."""
-        return any(
-            raw_data.get(key)
-            for key in [
-                "resume",
-                "photos",
-                "voice_notes",
-                "chat_transcripts",
-                "calendar_events",
-                "emails",
-                "social_posts",
-                "blog_posts",
-                "screenshots",
-                "shared_images",
-            ]
-        )
+        return any(raw_data.get(key) for key in _DATA_KEYS)
 
     @staticmethod
     def _summarize_raw_data(raw_data: Dict[str, Any]) -> str:
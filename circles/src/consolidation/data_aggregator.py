@@ -4,14 +4,17 @@ Data Aggregator - Collects and structures all user data sources for consolidatio
 Queries the database for all available data types and returns them in a structured format
 suitable for LLM consolidation.
 
-Uses asyncio.gather for parallel query execution to maximize performance.
+On PostgreSQL every source is fetched with one UNION ALL query; if that query
+fails, or on other databases, each source is queried on its own, one after
+another on the shared session. A failing per-source query is logged and that
+source comes back empty without preventing aggregation of the others.
 """
 
-import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import JSON, CompoundSelect, func, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..etl.core.result import Result
@@ -34,6 +37,66 @@ logger = logging.getLogger(__name__)
 class DataAggregator:
     """Aggregates all user data sources from database."""
 
+    # (result key, fetcher method) pairs, in aggregated output order
+    _FETCHERS: Tuple[Tuple[str, str], ...] = (
+        ("resume", "_get_resume_data"),
+        ("photos", "_get_photo_data"),
+        ("voice_notes", "_get_voice_note_data"),
+        ("chat_transcripts", "_get_chat_transcript_data"),
+        ("calendar_events", "_get_calendar_event_data"),
+        ("emails", "_get_email_data"),
+        ("social_posts", "_get_social_post_data"),
+        ("blog_posts", "_get_blog_post_data"),
+        ("screenshots", "_get_screenshot_data"),
+        ("shared_images", "_get_shared_image_data"),
+    )
+
+    # Result key -> (model, fields projected into each aggregated entry)
+    _SOURCES: ClassVar[Dict[str, Tuple[type, Tuple[str, ...]]]] = {
+        "resume": (ResumeData, ("full_text", "structured_data")),
+        "photos": (
+            Photo,
+            ("file_reference", "vlm_caption", "vlm_analysis", "exif_data"),
+        ),
+        "voice_notes": (
+            VoiceNote,
+            ("transcription", "language", "extracted_topics", "sentiment"),
+        ),
+        "chat_transcripts": (
+            ChatTranscript,
+            ("platform", "participants", "message_count", "messages"),
+        ),
+        "calendar_events": (
+            CalendarEvent,
+            ("events", "patterns", "interests", "timezone"),
+        ),
+        "emails": (
+            EmailData,
+            ("threads", "professional_interests", "communication_style"),
+        ),
+        "social_posts": (
+            SocialMediaPost,
+            ("platform", "caption", "vlm_outputs", "tags"),
+        ),
+        "blog_posts": (
+            BlogPost,
+            ("markdown_content", "topics", "tags", "writing_style"),
+        ),
+        "screenshots": (
+            Screenshot,
+            (
+                "file_reference",
+                "vlm_analysis",
+                "markdown_content",
+                "privacy_sensitive",
+            ),
+        ),
+        "shared_images": (
+            SharedImage,
+            ("file_reference", "user_context", "vlm_caption", "sharing_platform"),
+        ),
+    }
+
     def __init__(self, session: AsyncSession):
         """Initialize with database session."""
         self.session = session
@@ -42,11 +105,12 @@ class DataAggregator:
         self, user_id: str
     ) -> Result[Dict[str, Any], Exception]:
         """
-        Aggregate all available user data from multiple sources in parallel.
+        Aggregate all available user data from multiple sources.
 
-        Executes all database queries concurrently using asyncio.gather for
-        optimal performance. Individual query failures are logged but don't
-        prevent aggregation of other data sources.
+        On PostgreSQL all sources are fetched in a single UNION ALL query. If
+        that query fails, or on other databases, each source is queried on
+        its own instead. Individual per-source query failures are logged but
+        don't prevent aggregation of other data sources.
 
         Args:
             user_id: The user ID to aggregate data for
@@ -58,44 +122,14 @@ class DataAggregator:
             # Validate user_id format
             self._validate_user_id(user_id)
 
-            # Execute all queries in parallel for performance
-            logger.debug(f"Starting parallel data aggregation for user {user_id}")
-
-            (
-                resume,
-                photos,
-                voice_notes,
-                chat_transcripts,
-                calendar_events,
-                emails,
-                social_posts,
-                blog_posts,
-                screenshots,
-                shared_images,
-            ) = await asyncio.gather(
-                self._get_resume_data(user_id),
-                self._get_photo_data(user_id),
-                self._get_voice_note_data(user_id),
-                self._get_chat_transcript_data(user_id),
-                self._get_calendar_event_data(user_id),
-                self._get_email_data(user_id),
-                self._get_social_post_data(user_id),
-                self._get_blog_post_data(user_id),
-                self._get_screenshot_data(user_id),
-                self._get_shared_image_data(user_id),
-            )
+            if self._supports_batch_query():
+                results = await self._fetch_batched(user_id)
+            else:
+                results = await self._fetch_per_source(user_id)
 
             aggregated_data = {
-                "resume": resume,
-                "photos": photos,
-                "voice_notes": voice_notes,
-                "chat_transcripts": chat_transcripts,
-                "calendar_events": calendar_events,
-                "emails": emails,
-                "social_posts": social_posts,
-                "blog_posts": blog_posts,
-                "screenshots": screenshots,
-                "shared_images": shared_images,
+                key: fetched
+                for (key, _), fetched in zip(self._FETCHERS, results, strict=True)
             }
 
             logger.info(f"Successfully aggregated data for user {user_id}")
@@ -105,202 +139,127 @@ class DataAggregator:
             logger.error(f"Error aggregating user data for {user_id}: {e}")
             return Result.error(e)
 
-    async def _get_resume_data(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get resume data for user."""
+    async def _fetch_batched(self, user_id: str) -> List[Any]:
+        """Fetch every source in one round-trip, falling back per source."""
         try:
-            stmt = select(ResumeData).where(ResumeData.user_id == user_id)
-            result = await self.session.execute(stmt)
-            resume = result.scalars().first()
-
-            if resume:
-                return {
-                    "full_text": resume.full_text,
-                    "structured_data": resume.structured_data,
-                }
-            return None
+            # A savepoint keeps the session usable if the batch query fails
+            async with self.session.begin_nested():
+                fetched_data = await self._fetch_all_user_data(user_id)
         except Exception as e:
-            logger.debug(f"Error fetching resume for user {user_id}: {e}")
-            return None
+            logger.warning(
+                f"Batch data query failed for user {user_id}, "
+                f"falling back to per-source queries: {e}"
+            )
+            return await self._fetch_per_source(user_id)
+        return [fetched_data[key] for key, _ in self._FETCHERS]
+
+    async def _fetch_per_source(self, user_id: str) -> List[Any]:
+        """Run each source's fetcher in turn on the shared session."""
+        # One AsyncSession must not be used by concurrent queries
+        return [await getattr(self, fetcher)(user_id) for _, fetcher in self._FETCHERS]
+
+    async def _get_resume_data(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get resume data for user."""
+        rows = await self._fetch_rows("resume", user_id, limit=1)
+        return rows[0] if rows else None
 
     async def _get_photo_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get photo analyses for user."""
-        try:
-            stmt = select(Photo).where(Photo.user_id == user_id)
-            result = await self.session.execute(stmt)
-            photos = result.scalars().all()
-
-            return [
-                {
-                    "file_reference": photo.file_reference,
-                    "vlm_caption": photo.vlm_caption,
-                    "vlm_analysis": photo.vlm_analysis,
-                    "exif_data": photo.exif_data,
-                }
-                for photo in photos
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching photos for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("photos", user_id)
 
     async def _get_voice_note_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get voice note transcriptions for user."""
-        try:
-            stmt = select(VoiceNote).where(VoiceNote.user_id == user_id)
-            result = await self.session.execute(stmt)
-            voice_notes = result.scalars().all()
-
-            return [
-                {
-                    "transcription": note.transcription,
-                    "language": note.language,
-                    "extracted_topics": note.extracted_topics,
-                    "sentiment": note.sentiment,
-                }
-                for note in voice_notes
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching voice notes for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("voice_notes", user_id)
 
     async def _get_chat_transcript_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get chat transcript data for user."""
-        try:
-            stmt = select(ChatTranscript).where(ChatTranscript.user_id == user_id)
-            result = await self.session.execute(stmt)
-            chats = result.scalars().all()
-
-            return [
-                {
-                    "platform": chat.platform,
-                    "participants": chat.participants,
-                    "message_count": chat.message_count,
-                    "messages": chat.messages,
-                }
-                for chat in chats
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching chat transcripts for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("chat_transcripts", user_id)
 
     async def _get_calendar_event_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get calendar event data for user."""
-        try:
-            stmt = select(CalendarEvent).where(CalendarEvent.user_id == user_id)
-            result = await self.session.execute(stmt)
-            events = result.scalars().all()
-
-            return [
-                {
-                    "events": event.events,
-                    "patterns": event.patterns,
-                    "interests": event.interests,
-                    "timezone": event.timezone,
-                }
-                for event in events
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching calendar events for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("calendar_events", user_id)
 
     async def _get_email_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get email data for user."""
-        try:
-            stmt = select(EmailData).where(EmailData.user_id == user_id)
-            result = await self.session.execute(stmt)
-            emails = result.scalars().all()
-
-            return [
-                {
-                    "threads": email.threads,
-                    "professional_interests": email.professional_interests,
-                    "communication_style": email.communication_style,
-                }
-                for email in emails
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching email data for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("emails", user_id)
 
     async def _get_social_post_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get social media post data for user."""
-        try:
-            stmt = select(SocialMediaPost).where(SocialMediaPost.user_id == user_id)
-            result = await self.session.execute(stmt)
-            posts = result.scalars().all()
-
-            return [
-                {
-                    "platform": post.platform,
-                    "caption": post.caption,
-                    "vlm_outputs": post.vlm_outputs,
-                    "tags": post.tags,
-                }
-                for post in posts
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching social posts for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("social_posts", user_id)
 
     async def _get_blog_post_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get blog post data for user."""
-        try:
-            stmt = select(BlogPost).where(BlogPost.user_id == user_id)
-            result = await self.session.execute(stmt)
-            blogs = result.scalars().all()
-
-            return [
-                {
-                    "markdown_content": blog.markdown_content,
-                    "topics": blog.topics,
-                    "tags": blog.tags,
-                    "writing_style": blog.writing_style,
-                }
-                for blog in blogs
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching blog posts for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("blog_posts", user_id)
 
     async def _get_screenshot_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get screenshot data for user."""
-        try:
-            stmt = select(Screenshot).where(Screenshot.user_id == user_id)
-            result = await self.session.execute(stmt)
-            screenshots = result.scalars().all()
-
-            return [
-                {
-                    "file_reference": screenshot.file_reference,
-                    "vlm_analysis": screenshot.vlm_analysis,
-                    "markdown_content": screenshot.markdown_content,
-                    "privacy_sensitive": screenshot.privacy_sensitive,
-                }
-                for screenshot in screenshots
-            ]
-        except Exception as e:
-            logger.debug(f"Error fetching screenshots for user {user_id}: {e}")
-            return []
+        return await self._fetch_rows("screenshots", user_id)
 
     async def _get_shared_image_data(self, user_id: str) -> List[Dict[str, Any]]:
         """Get shared image data for user."""
+        return await self._fetch_rows("shared_images", user_id)
+
+    async def _fetch_rows(
+        self, key: str, user_id: str, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Query one data source and project its rows onto the source fields."""
+        model, fields = self._SOURCES[key]
         try:
-            stmt = select(SharedImage).where(SharedImage.user_id == user_id)
+            stmt = select(model).where(model.user_id == user_id).limit(limit)
             result = await self.session.execute(stmt)
-            images = result.scalars().all()
+            rows = result.scalars()
+            rows = [rows.first()] if limit == 1 else rows.all()
 
             return [
-                {
-                    "file_reference": image.file_reference,
-                    "user_context": image.user_context,
-                    "vlm_caption": image.vlm_caption,
-                    "sharing_platform": image.sharing_platform,
-                }
-                for image in images
+                {field: getattr(row, field) for field in fields}
+                for row in rows
+                if row is not None
             ]
         except Exception as e:
-            logger.debug(f"Error fetching shared images for user {user_id}: {e}")
+            logger.debug(f"Error fetching {key} for user {user_id}: {e}")
             return []
 
+    def _build_batch_query(self, user_id: str) -> CompoundSelect:
+        """
+        Build a single UNION ALL query covering every data source.
+
+        Each branch yields (kind, data) rows where data is a JSON object with
+        the source fields, so all sources come back in one round-trip.
+        """
+        branches = []
+        for key, (model, fields) in self._SOURCES.items():
+            data = func.json_build_object(
+                *chain.from_iterable(
+                    (literal_column(f"'{field}'"), getattr(model, field))
+                    for field in fields
+                ),
+                type_=JSON,
+            )
+            branches.append(
+                select(
+                    literal_column(f"'{key}'").label("kind"), data.label("data")
+                ).where(model.user_id == user_id)
+            )
+        return union_all(*branches)
+
+    async def _fetch_all_user_data(self, user_id: str) -> Dict[str, Any]:
+        """Fetch every data source in one query and bucket rows by source."""
+        result = await self.session.execute(self._build_batch_query(user_id))
+
+        buckets: Dict[str, List[Dict[str, Any]]] = {key: [] for key in self._SOURCES}
+        for kind, data in result.all():
+            buckets[kind].append(data)
+
+        resume = buckets.pop("resume")
+        return {"resume": resume[0] if resume else None, **buckets}
+
+    def _supports_batch_query(self) -> bool:
+        """Whether the session's database can run the JSON UNION ALL query."""
+        try:
+            return self.session.get_bind().dialect.name == "postgresql"
+        except Exception:
+            return False
+
     def _validate_user_id(self, user_id: str) -> None:
         """
         Validate user_id is a positive integer.
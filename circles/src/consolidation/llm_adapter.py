@@ -12,7 +12,7 @@ import json
 import logging
 import re
 from asyncio import Semaphore
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, Optional, Protocol
 
 import anthropic
 from openai import OpenAI
@@ -21,6 +21,15 @@ from ..etl.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Structural characters for the embedded-object scanner
+_JSON_TOKEN_RE = re.compile(r'[{}"\\]')
+
+# Providers shared by LLMProviderFactory. Each holds an asyncio.Semaphore that
+# binds to the loop it is first contended on, and Celery runs every task under
+# its own loop, so the cache is dropped when the running loop changes.
+_providers: Dict[str, "LLMProvider"] = {}
+_providers_loop: Optional[asyncio.AbstractEventLoop] = None
+
 
 class LLMProvider(Protocol):
     """Protocol for LLM providers."""
@@ -219,12 +228,18 @@ class OpenAILLMProvider:
 
 
 class LLMProviderFactory:
-    """Factory for creating LLM provider instances."""
+    """
+    Factory for creating LLM provider instances.
+
+    Providers are cached per name and event loop, so repeated orchestrators
+    on one loop share a client (and its HTTP connection pool) and a
+    concurrency semaphore.
+    """
 
     @staticmethod
     def create(provider_name: str = "anthropic") -> LLMProvider:
         """
-        Create LLM provider instance.
+        Get the shared LLM provider instance for a provider name.
 
         Args:
             provider_name: Provider name ('anthropic' or 'openai')
@@ -235,18 +250,69 @@ class LLMProviderFactory:
         Raises:
             ValueError: If provider_name is not supported
         """
-        if provider_name.lower() == "openai":
-            return OpenAILLMProvider()
-        elif provider_name.lower() == "anthropic":
-            return AnthropicLLMProvider()
-        else:
+        global _providers_loop
+
+        name = provider_name.lower()
+        if name not in ("openai", "anthropic"):
             raise ValueError(f"Unknown LLM provider: {provider_name}")
 
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if _providers_loop is not loop:
+            _providers.clear()
+            _providers_loop = loop
+
+        provider = _providers.get(name)
+        if provider is None:
+            # Failed constructions raise before anything is cached
+            if name == "openai":
+                provider = _providers[name] = OpenAILLMProvider()
+            else:
+                provider = _providers[name] = AnthropicLLMProvider()
+        return provider
+
+
+def _find_json_object(text: str, start: int) -> Optional[str]:
+    """
+    Return the brace-balanced object starting at text[start], if it closes.
+
+    Jumps between structural characters with a compiled regex so the scan is
+    a single linear pass; braces inside strings and escapes are ignored.
+    """
+    depth = 0
+    in_string = False
+    skip_until = -1
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        pos = match.start()
+        if pos < skip_until:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                skip_until = pos + 2
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : pos + 1]
+    return None
+
 
 def parse_json_response(response_text: str) -> Dict[str, Any]:
     """
     Parse JSON from LLM response.
 
+    Falls back to the first brace-balanced object embedded in surrounding
+    text (e.g. prose or markdown fences) when the response isn't pure JSON.
+
     Args:
         response_text: The LLM's text response
 
@@ -260,15 +326,18 @@ def parse_json_response(response_text: str) -> Dict[str, Any]:
         # First try direct JSON parsing
         return json.loads(response_text)
     except json.JSONDecodeError:
-        # Try to extract JSON from response using regex
-        json_match = re.search(
-            r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", response_text, re.DOTALL
-        )
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse extracted JSON: {e}")
-                raise ValueError("Could not parse JSON from LLM response") from e
-        else:
-            raise ValueError("No JSON found in LLM response")
+        pass
+
+    start = response_text.find("{")
+    if start == -1:
+        raise ValueError("No JSON found in LLM response")
+
+    candidate = _find_json_object(response_text, start)
+    if candidate is None:
+        raise ValueError("Could not parse JSON from LLM response")
+
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse extracted JSON: {e}")
+        raise ValueError("Could not parse JSON from LLM response") from e
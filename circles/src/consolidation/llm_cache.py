@@ -0,0 +1,129 @@
+"""
+LLM Response Cache - Persists consolidation responses keyed by prompt hash.
+
+Consolidation prompts are large and LLM calls are slow and billed per token,
+so identical (prompt version, provider, prompt) triples are served from a
+small SQLite table instead of re-querying the provider.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Union
+
+from ..etl.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    hash TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    expires_at INTEGER
+)
+"""
+
+
+class LLMCache:
+    """
+    SQLite-backed cache for raw LLM responses.
+
+    Blocking sqlite3 calls run in a worker thread so the event loop is not
+    stalled. A fresh connection is opened per call, which keeps the cache
+    safe to share between threads and worker processes.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl_seconds: Optional[int] = None):
+        """
+        Initialize cache, creating the database file if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: Optional lifetime of cached entries (None = no expiry)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    @staticmethod
+    def make_key(prompt_version: str, provider: str, prompt: str) -> str:
+        """Build the SHA-256 cache key for a prompt sent to a provider."""
+        digest = hashlib.sha256()
+        for part in (prompt_version, provider, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on miss/expiry."""
+        try:
+            return await asyncio.to_thread(self._get, key)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    async def set(
+        self, key: str, provider: str, prompt_version: str, response: str
+    ) -> None:
+        """Store a response under key, replacing any previous entry."""
+        try:
+            await asyncio.to_thread(self._set, key, provider, prompt_version, response)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def _get(self, key: str) -> Optional[str]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response, expires_at FROM llm_cache WHERE hash = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        response, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return response
+
+    def _set(
+        self, key: str, provider: str, prompt_version: str, response: str
+    ) -> None:
+        now = int(time.time())
+        expires_at = now + self.ttl_seconds if self.ttl_seconds else None
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(hash, provider, prompt_version, response, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, provider, prompt_version, response, now, expires_at),
+            )
+
+
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """
+    Get the shared LLM cache configured in settings.
+
+    Returns:
+        LLMCache instance, or None when llm_cache_path is not set
+    """
+    global _llm_cache
+    settings = get_settings()
+    if not settings.llm_cache_path:
+        return None
+    if _llm_cache is None:
+        _llm_cache = LLMCache(settings.llm_cache_path, settings.llm_cache_ttl_seconds)
+    return _llm_cache
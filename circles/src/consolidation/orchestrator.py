@@ -14,6 +14,7 @@ from ..etl.core.result import Result
 from ..profile_schema import UserProfile
 from .data_aggregator import DataAggregator
 from .llm_adapter import LLMProvider, LLMProviderFactory
+from .llm_cache import get_llm_cache
 from .strategy import ConsolidationStrategy, DefaultConsolidationStrategy
 
 logger = logging.getLogger(__name__)
@@ -140,7 +141,7 @@ class ProfileConsolidationOrchestrator:
             return self.strategy
 
         # Default to DefaultConsolidationStrategy
-        return DefaultConsolidationStrategy(user_id)
+        return DefaultConsolidationStrategy(user_id, cache=get_llm_cache())
 
     async def _persist_profile(
         self, profile: UserProfile
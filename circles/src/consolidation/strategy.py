@@ -6,7 +6,7 @@ Implementations of this protocol handle profile consolidation with injected LLM
 
 import json
 import logging
-from typing import Any, Dict, Protocol
+from typing import Any, Dict, Optional, Protocol
 
 from pydantic import ValidationError
 
@@ -14,9 +14,120 @@ from ..etl.core.result import Result
 from ..profile_schema import UserProfile
 from .base_consolidation_strategy import BaseConsolidationStrategy
 from .llm_adapter import LLMProvider, parse_json_response
+from .llm_cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the consolidation prompt template changes so cached
+# responses produced by the old template are no longer served.
+PROMPT_VERSION = "v1"
+
+# Static parts of the consolidation prompt, split around the two dynamic
+# sections so building a prompt is a single join instead of re-expanding
+# the whole template on every call.
+_PROMPT_PREFIX = """You are an expert psychologist and data analyst specializing in user profiling.
+Analyze the following user data and consolidate it into a comprehensive user profile.
+
+USER DATA SUMMARY:
+"""
+_PROMPT_MIDDLE = """
+
+DETAILED USER DATA:
+"""
+_PROMPT_SUFFIX = """
+
+Based on this data, generate a JSON response with the following structure:
+{
+  "bio": "<A brief 1-2 sentence personal bio or description (optional)>",
+  "interests": [
+    {"title": "Interest Title", "description": "Brief description of this interest"},
+    {"title": "Another Interest", "description": "What they do or why it matters to them"}
+  ],
+  "profile_completed": <true/false - whether profile is comprehensive>,
+  "personality_core": {
+    "openness": "<High/Medium/Low description>",
+    "conscientiousness": "<High/Medium/Low description>",
+    "extraversion": "<High/Medium/Low description>",
+    "agreeableness": "<High/Medium/Low description>",
+    "emotional_stability": "<High/Medium/Low description>",
+    "social_match_implications": "<How personality affects social matching>"
+  },
+  "social_interaction_style": {
+    "preferred_group_size": "<Solo/Pair/Small group/Large group>",
+    "meeting_structure": "<Structured/Unstructured/Flexible>",
+    "tone": "<Formal/Casual/Mixed>",
+    "communication_style": "<Direct/Indirect/Mixed>",
+    "response_latency": "<Immediate/Quick/Thoughtful>",
+    "conversation_pacing": "<Fast/Moderate/Slow>",
+    "comfort_zones_and_boundaries": {
+      "energy_constraints": "<Description of energy preferences>",
+      "safety_preferences": "<Safety concerns or preferences>",
+      "time_of_day_comfort": "<Morning/Afternoon/Evening/Flexible>",
+      "pace_of_progress": "<Fast/Steady/Slow>",
+      "topics_to_avoid": ["topic1", "topic2"]
+    }
+  },
+  "motivations_and_goals": {
+    "primary_goal": "<User's main objective>",
+    "secondary_goal": "<Secondary objectives>",
+    "underlying_needs": ["need1", "need2", "need3"]
+  },
+  "skills_and_identity": {
+    "skills": ["skill1", "skill2", "skill3"],
+    "skill_levels": {"skill1": "Expert", "skill2": "Intermediate"},
+    "experience": "<Years and type of experience>",
+    "identity_tags": ["tag1", "tag2"]
+  },
+  "lifestyle_and_rhythms": {
+    "availability": {
+      "weekday_evenings": "<Available/Limited/Unavailable>",
+      "weekend_mornings": "<Available/Limited/Unavailable>"
+    },
+    "weekly_rhythm": "<Weekly pattern description>",
+    "preferred_locations": ["location1", "location2"],
+    "mobility": {
+      "preferred_radius_km": <number>,
+      "transport_modes": ["mode1", "mode2"]
+    },
+    "environmental_context": {
+      "local_area_familiarity": "<High/Medium/Low>",
+      "high_density_areas_exposure": "<Comfortable/Neutral/Uncomfortable>"
+    }
+  },
+  "conversation_micro_preferences": {
+    "preferred_opener_style": "<Question/Statement/Story>",
+    "emoji_usage": "<Frequent/Moderate/Minimal>",
+    "humor_style": "<Witty/Warm/Sarcastic/None>",
+    "formality_level": "<Formal/Semi-formal/Casual>",
+    "preferred_medium": "<Text/Voice/Video/Flexible>",
+    "default_tone": "<Tone preference>"
+  },
+  "behavioral_history_model": {
+    "match_acceptance_pattern": "<Pattern of acceptance>",
+    "match_decline_pattern": "<Pattern of declination>",
+    "good_outcomes_pattern": "<What leads to good outcomes>",
+    "response_latency_pattern": "<Typical response time>",
+    "conversation_patterns": "<How conversations typically flow>"
+  },
+  "agent_persona_heuristic": {
+    "voice": "<Recommended AI voice style>",
+    "decision_priorities": {"priority1": "weight", "priority2": "weight"},
+    "tone_guidance": "<How AI should communicate>",
+    "risk_tolerance": "<High/Medium/Low>",
+    "serendipity_openness": "<How open to unexpected matches>"
+  }
+}
+
+IMPORTANT REQUIREMENTS:
+1. Use only the data provided - infer conservatively
+2. If a section lacks sufficient data, provide reasonable defaults based on available information
+3. Extract 3-7 key interests from calendar, emails, social posts, and other data
+4. Keep each interest title short (2-5 words) and description concise (1-2 sentences)
+5. All fields are optional - include only those with sufficient data support
+6. Ensure all values are strings or appropriate data types
+7. Be specific and actionable in descriptions
+8. Return ONLY the JSON object, no additional text"""
+
 
 class ConsolidationStrategy(Protocol):
     """
@@ -67,14 +178,16 @@ class DefaultConsolidationStrategy(BaseConsolidationStrategy):
     Inherits validation and utility methods from BaseConsolidationStrategy.
     """
 
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, cache: Optional[LLMCache] = None):
         """
         Initialize strategy with user context.
 
         Args:
             user_id: The user ID being consolidated
+            cache: Optional LLM response cache keyed by prompt hash
         """
         super().__init__(user_id)
+        self.cache = cache
 
     async def consolidate(
         self,
@@ -107,14 +220,34 @@ class DefaultConsolidationStrategy(BaseConsolidationStrategy):
             # Build prompt with all user data
             prompt = self._build_consolidation_prompt(raw_data)
 
-            # Call LLM via injected provider
-            response_text = await llm_provider.call(prompt)
+            # Serve identical prompts from cache before calling the LLM
+            cache_key = None
+            response_text = None
+            if self.cache is not None:
+                provider_name = llm_provider.get_provider_name()
+                cache_key = LLMCache.make_key(PROMPT_VERSION, provider_name, prompt)
+                response_text = await self.cache.get(cache_key)
+                if response_text is not None:
+                    logger.info(f"LLM cache hit for user {user_id}")
+
+            cached = response_text is not None
+            if not cached:
+                # Call LLM via injected provider
+                response_text = await llm_provider.call(prompt)
 
             # Parse JSON from response
             profile_data = parse_json_response(response_text)
 
             # Validate and construct profile
-            return self._validate_profile(profile_data)
+            result = self._validate_profile(profile_data)
+
+            # Only cache responses that produced a valid profile
+            if cache_key is not None and not cached and result.is_ok:
+                await self.cache.set(
+                    cache_key, provider_name, PROMPT_VERSION, response_text
+                )
+
+            return result
 
         except Exception as e:
             logger.error(f"Error consolidating profile for user {user_id}: {e}")
@@ -132,105 +265,14 @@ class DefaultConsolidationStrategy(BaseConsolidationStrategy):
         """
         data_summary = self._summarize_raw_data(raw_data)
 
-        prompt = f"""You are an expert psychologist and data analyst specializing in user profiling.
-Analyze the following user data and consolidate it into a comprehensive user profile.
-
-USER DATA SUMMARY:
-{data_summary}
-
-DETAILED USER DATA:
-{json.dumps(raw_data, indent=2, default=str)}
-
-Based on this data, generate a JSON response with the following structure:
-{{
-  "bio": "<A brief 1-2 sentence personal bio or description (optional)>",
-  "interests": [
-    {{"title": "Interest Title", "description": "Brief description of this interest"}},
-    {{"title": "Another Interest", "description": "What they do or why it matters to them"}}
-  ],
-  "profile_completed": <true/false - whether profile is comprehensive>,
-  "personality_core": {{
-    "openness": "<High/Medium/Low description>",
-    "conscientiousness": "<High/Medium/Low description>",
-    "extraversion": "<High/Medium/Low description>",
-    "agreeableness": "<High/Medium/Low description>",
-    "emotional_stability": "<High/Medium/Low description>",
-    "social_match_implications": "<How personality affects social matching>"
-  }},
-  "social_interaction_style": {{
-    "preferred_group_size": "<Solo/Pair/Small group/Large group>",
-    "meeting_structure": "<Structured/Unstructured/Flexible>",
-    "tone": "<Formal/Casual/Mixed>",
-    "communication_style": "<Direct/Indirect/Mixed>",
-    "response_latency": "<Immediate/Quick/Thoughtful>",
-    "conversation_pacing": "<Fast/Moderate/Slow>",
-    "comfort_zones_and_boundaries": {{
-      "energy_constraints": "<Description of energy preferences>",
-      "safety_preferences": "<Safety concerns or preferences>",
-      "time_of_day_comfort": "<Morning/Afternoon/Evening/Flexible>",
-      "pace_of_progress": "<Fast/Steady/Slow>",
-      "topics_to_avoid": ["topic1", "topic2"]
-    }}
-  }},
-  "motivations_and_goals": {{
-    "primary_goal": "<User's main objective>",
-    "secondary_goal": "<Secondary objectives>",
-    "underlying_needs": ["need1", "need2", "need3"]
-  }},
-  "skills_and_identity": {{
-    "skills": ["skill1", "skill2", "skill3"],
-    "skill_levels": {{"skill1": "Expert", "skill2": "Intermediate"}},
-    "experience": "<Years and type of experience>",
-    "identity_tags": ["tag1", "tag2"]
-  }},
-  "lifestyle_and_rhythms": {{
-    "availability": {{
-      "weekday_evenings": "<Available/Limited/Unavailable>",
-      "weekend_mornings": "<Available/Limited/Unavailable>"
-    }},
-    "weekly_rhythm": "<Weekly pattern description>",
-    "preferred_locations": ["location1", "location2"],
-    "mobility": {{
-      "preferred_radius_km": <number>,
-      "transport_modes": ["mode1", "mode2"]
-    }},
-    "environmental_context": {{
-      "local_area_familiarity": "<High/Medium/Low>",
-      "high_density_areas_exposure": "<Comfortable/Neutral/Uncomfortable>"
-    }}
-  }},
-  "conversation_micro_preferences": {{
-    "preferred_opener_style": "<Question/Statement/Story>",
-    "emoji_usage": "<Frequent/Moderate/Minimal>",
-    "humor_style": "<Witty/Warm/Sarcastic/None>",
-    "formality_level": "<Formal/Semi-formal/Casual>",
-    "preferred_medium": "<Text/Voice/Video/Flexible>",
-    "default_tone": "<Tone preference>"
-  }},
-  "behavioral_history_model": {{
-    "match_acceptance_pattern": "<Pattern of acceptance>",
-    "match_decline_pattern": "<Pattern of declination>",
-    "good_outcomes_pattern": "<What leads to good outcomes>",
-    "response_latency_pattern": "<Typical response time>",
-    "conversation_patterns": "<How conversations typically flow>"
-  }},
-  "agent_persona_heuristic": {{
-    "voice": "<Recommended AI voice style>",
-    "decision_priorities": {{"priority1": "weight", "priority2": "weight"}},
-    "tone_guidance": "<How AI should communicate>",
-    "risk_tolerance": "<High/Medium/Low>",
-    "serendipity_openness": "<How open to unexpected matches>"
-  }}
-}}
-
-IMPORTANT REQUIREMENTS:
-1. Use only the data provided - infer conservatively
-2. If a section lacks sufficient data, provide reasonable defaults based on available information
-3. Extract 3-7 key interests from calendar, emails, social posts, and other data
-4. Keep each interest title short (2-5 words) and description concise (1-2 sentences)
-5. All fields are optional - include only those with sufficient data support
-6. Ensure all values are strings or appropriate data types
-7. Be specific and actionable in descriptions
-8. Return ONLY the JSON object, no additional text"""
+        prompt = "".join(
+            (
+                _PROMPT_PREFIX,
+                data_summary,
+                _PROMPT_MIDDLE,
+                json.dumps(raw_data, indent=2, default=str),
+                _PROMPT_SUFFIX,
+            )
+        )
 
         return prompt
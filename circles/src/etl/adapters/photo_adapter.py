@@ -11,7 +11,7 @@ Supports both single image and batch processing with parallel VLM calls.
 """
 
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,6 +25,16 @@ from .base import AdapterContext, BaseAdapter, DataType, ProcessorResult
 class PhotoAdapter(BaseAdapter[Path, Photo]):
     """Photo file adapter with VLM analysis."""
 
+    def __init__(self, processor: Optional[PhotoProcessor] = None):
+        """
+        Initialize adapter.
+
+        Args:
+            processor: Optional processor used by the process phase. When
+                omitted, a new PhotoProcessor is created for each call.
+        """
+        self._processor = processor
+
     @property
     def data_type(self) -> DataType:
         return DataType.PHOTO
@@ -88,7 +98,7 @@ class PhotoAdapter(BaseAdapter[Path, Photo]):
         Extracts visual captions and detailed analysis.
         """
         try:
-            processor = PhotoProcessor()
+            processor = self._processor or PhotoProcessor()
             result = await processor.process(input_data)
 
             # Convert SimpleProcessorResult to ProcessorResult protocol
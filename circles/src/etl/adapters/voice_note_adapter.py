@@ -8,15 +8,69 @@ Implements the 4-phase pipeline:
 4. Cleanup - Remove temporary files
 """
 
+import asyncio
+import copy
+import hashlib
+import mmap
+import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..core import ProcessingError, Result, SecureFileValidator
+from ..core import ProcessingError, Result, SecureFileValidator, get_settings
 from ..models import VoiceNote
 from ..processors.voice_note_processor import VoiceNoteProcessor
+from ..repositories import VoiceNoteRepository
 from .base import AdapterContext, BaseAdapter, DataType, ProcessorResult
 
+# Bytes read for magic-byte sniffing; m4a needs "ftyp" at offset 4
+_HEADER_SIZE = 16
+_ZIP_MAGIC = b"\x50\x4b\x03\x04"
+
+# In-process LRU of transcriptions keyed by (content sha256, suffix, model).
+# Retries and re-uploads of identical audio skip the Whisper call entirely.
+_TRANSCRIPTION_CACHE_SIZE = 512
+_transcription_cache: "OrderedDict[Tuple[str, str, str], ProcessorResult]" = (
+    OrderedDict()
+)
+
+
+def _hash_file(file_path: Path) -> str:
+    """Return the sha256 hex digest of a file, hashed from a read-only mmap."""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"").hexdigest()  # mmap can't map empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+async def _transcription_cache_key(file_path: Path) -> Tuple[str, str, str]:
+    """Build the transcription cache key, hashing the file off the event loop."""
+    content_hash = await asyncio.to_thread(_hash_file, file_path)
+    return content_hash, file_path.suffix.lower(), get_settings().whisper_model
+
+
+def _get_cached_transcription(key: Tuple[str, str, str]) -> Optional[ProcessorResult]:
+    """Return a private copy of a cached transcription, or None on a miss."""
+    cached = _transcription_cache.get(key)
+    if cached is None:
+        return None
+    _transcription_cache.move_to_end(key)
+    # Callers may mutate content/metadata; never hand out the cached object
+    return copy.deepcopy(cached)
+
+
+def _cache_transcription(key: Tuple[str, str, str], result: ProcessorResult) -> None:
+    """Cache a copy of a successful transcription, evicting the oldest entry."""
+    # Failed transcriptions come back with zero confidence; don't pin them
+    if (result.metadata or {}).get("confidence", 0.0) <= 0.0:
+        return
+    _transcription_cache[key] = copy.deepcopy(result)
+    if len(_transcription_cache) > _TRANSCRIPTION_CACHE_SIZE:
+        _transcription_cache.popitem(last=False)
+
 
 class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
     """Voice note file adapter with Whisper transcription."""
@@ -31,7 +85,7 @@ class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
 
     @property
     def repository_class(self) -> type:
-        return None  # Using direct model operations for MVP
+        return VoiceNoteRepository
 
     async def validate_input(
         self, input_data: Path, context: AdapterContext
@@ -45,16 +99,47 @@ class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
         - File size is reasonable (max 50MB)
         - File is not malicious
         """
-        if not input_data.exists():
+        # Extension is checked first; unsupported uploads cost no I/O
+        extension_result = SecureFileValidator.validate_extension(
+            input_data.name, "audio"
+        )
+        if not extension_result.is_valid:
+            error = ProcessingError(
+                extension_result.error or "File validation failed",
+                error_type="validation_error",
+            )
+            return Result.error(error)
+
+        if not await asyncio.to_thread(input_data.exists):
             error = ProcessingError(
                 f"Audio file not found: {input_data}", error_type="file_not_found"
             )
             return Result.error(error)
 
-        # Read content for validation
+        # Size comes from stat, so oversized uploads are rejected unread
         try:
-            with open(input_data, "rb") as f:
-                content = f.read()
+            file_size = (await asyncio.to_thread(input_data.stat)).st_size
+        except OSError as e:
+            error = ProcessingError(
+                f"Failed to read file: {e}", error_type="file_read_error"
+            )
+            return Result.error(error)
+
+        max_size = SecureFileValidator.MAX_FILE_SIZES["audio"]
+        if file_size > max_size:
+            error = ProcessingError(
+                f"File size {file_size} exceeds maximum {max_size}",
+                error_type="validation_error",
+            )
+            return Result.error(error)
+
+        # Only the header is needed for sniffing; ZIP payloads are read in
+        # full so the zip bomb check still sees the whole archive
+        try:
+            with input_data.open("rb") as f:
+                content = f.read(_HEADER_SIZE)
+                if content.startswith(_ZIP_MAGIC):
+                    content += f.read()
         except Exception as e:
             error = ProcessingError(
                 f"Failed to read file: {e}", error_type="file_read_error"
@@ -81,11 +166,18 @@ class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
         """
         Phase 2: Process audio file with Whisper.
 
-        Transcribes audio and extracts metadata.
+        Transcribes audio and extracts metadata. Results are cached by
+        content hash, so identical audio is only sent to Whisper once.
         """
         try:
+            cache_key = await _transcription_cache_key(input_data)
+            cached = _get_cached_transcription(cache_key)
+            if cached is not None:
+                return Result.ok(cached)
+
             processor = VoiceNoteProcessor()
             result = await processor.process(input_data)
+            _cache_transcription(cache_key, result)
 
             # Convert SimpleProcessorResult to ProcessorResult protocol
             return Result.ok(result)
@@ -96,6 +188,53 @@ class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
             )
             return Result.error(error)
 
+    async def process_batch(
+        self, file_paths: List[Path], context: AdapterContext
+    ) -> Result[List[ProcessorResult], ProcessingError]:
+        """
+        Transcribe multiple audio files with a single processor.
+
+        Files are looked up in the same transcription cache as process();
+        only misses reach the processor, which bounds concurrent Whisper
+        calls with its semaphore. Unreadable files skip the cache and are
+        left to the processor to report.
+
+        Args:
+            file_paths: List of audio file paths
+            context: Adapter context
+
+        Returns:
+            Result with list of processor results
+        """
+        try:
+            cache_keys = await asyncio.gather(
+                *(_transcription_cache_key(path) for path in file_paths),
+                return_exceptions=True,
+            )
+            results: List[Optional[ProcessorResult]] = [
+                None if isinstance(key, Exception) else _get_cached_transcription(key)
+                for key in cache_keys
+            ]
+
+            misses = [i for i, result in enumerate(results) if result is None]
+            if misses:
+                processor = VoiceNoteProcessor()
+                transcribed = await processor.process_batch(
+                    [file_paths[i] for i in misses]
+                )
+                for i, result in zip(misses, transcribed, strict=True):
+                    if not isinstance(cache_keys[i], Exception):
+                        _cache_transcription(cache_keys[i], result)
+                    results[i] = result
+
+            return Result.ok(results)
+
+        except Exception as e:
+            error = ProcessingError(
+                f"Batch transcription failed: {e}", error_type="processing_error"
+            )
+            return Result.error(error)
+
     async def persist(
         self,
         processor_result: ProcessorResult,
@@ -144,6 +283,41 @@ class VoiceNoteAdapter(BaseAdapter[Path, VoiceNote]):
             )
             return Result.error(error)
 
+    async def persist_batch(
+        self,
+        processor_results: List[ProcessorResult],
+        context: AdapterContext,
+        session: AsyncSession,
+    ) -> Result[List[VoiceNote], ProcessingError]:
+        """
+        Persist multiple processed voice notes efficiently.
+
+        Uses batch insert for better database performance.
+
+        Args:
+            processor_results: List of processor results
+            context: Adapter context
+            session: Database session
+
+        Returns:
+            Result with list of created voice note records
+        """
+        try:
+            repository = VoiceNoteRepository()
+            voice_notes = await repository.create_batch_from_processor_results(
+                user_id=context.user_id,
+                source_id=context.source_id,
+                processor_results=processor_results,
+                session=session,
+            )
+            return Result.ok(voice_notes)
+
+        except Exception as e:
+            error = ProcessingError(
+                f"Batch persistence failed: {e}", error_type="persistence_error"
+            )
+            return Result.error(error)
+
     async def cleanup(self, input_data: Path, context: AdapterContext) -> None:
         """Phase 4: Cleanup temporary files."""
         await super().cleanup(input_data, context)
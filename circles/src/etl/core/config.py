@@ -100,6 +100,10 @@ class Settings(BaseSettings):
     max_retries: int = 3
     retry_delay_seconds: int = 5
 
+    # LLM response cache for profile consolidation (disabled when path unset)
+    llm_cache_path: Optional[str] = None
+    llm_cache_ttl_seconds: Optional[int] = 7 * 24 * 3600  # 1 week
+
     # ========================================================================
     # BATCH PROCESSING
     # ========================================================================
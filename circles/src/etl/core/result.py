@@ -27,13 +27,16 @@ E = TypeVar("E")  # Error type
 U = TypeVar("U")  # Mapped success type
 
 
-@dataclass
+@dataclass(slots=True)
 class Result(Generic[T, E]):
     """
     Represents a computation that may succeed with value T or fail with error E.
 
     This is a monad implementation that forces explicit error handling.
     Never raises exceptions for business logic errors.
+
+    Slotted: a Result wraps nearly every pipeline return, so instances skip
+    the per-object __dict__.
     """
 
     _value: Union[T, E]
@@ -14,7 +14,17 @@ import re
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+def _index_magic_bytes(
+    magic_bytes: Dict[bytes, str], key_len: int
+) -> Dict[bytes, Tuple[Tuple[bytes, str], ...]]:
+    """Group magic byte signatures by their first key_len bytes."""
+    index: Dict[bytes, List[Tuple[bytes, str]]] = {}
+    for magic, mime_type in magic_bytes.items():
+        index.setdefault(magic[:key_len], []).append((magic, mime_type))
+    return {key: tuple(candidates) for key, candidates in index.items()}
 
 
 @dataclass
@@ -40,11 +50,11 @@ class SecureFileValidator:
     """
 
     # Allowed file types
-    ALLOWED_EXTENSIONS: Dict[str, Set[str]] = {
-        "resume": {".pdf", ".docx", ".txt"},
-        "image": {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic"},
-        "audio": {".mp3", ".wav", ".ogg", ".webm", ".m4a"},
-        "calendar": {".ics"},
+    ALLOWED_EXTENSIONS: Dict[str, FrozenSet[str]] = {
+        "resume": frozenset({".pdf", ".docx", ".txt"}),
+        "image": frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic"}),
+        "audio": frozenset({".mp3", ".wav", ".ogg", ".webm", ".m4a"}),
+        "calendar": frozenset({".ics"}),
     }
 
     # Magic bytes for file type detection
@@ -56,6 +66,9 @@ class SecureFileValidator:
         b"GIF87a": "image/gif",
         b"GIF89a": "image/gif",
     }
+    # Index prefix length: the shortest signature, so every one is reachable
+    _MAGIC_KEY_LEN = min(map(len, MAGIC_BYTES))
+    _MAGIC_INDEX = _index_magic_bytes(MAGIC_BYTES, _MAGIC_KEY_LEN)
 
     # File size limits (in bytes)
     MAX_FILE_SIZES: Dict[str, int] = {
@@ -103,7 +116,9 @@ class SecureFileValidator:
     @staticmethod
     def validate_extension(filename: str, file_type: str) -> ValidationResult:
         """Validate file extension against whitelist."""
-        allowed_exts = SecureFileValidator.ALLOWED_EXTENSIONS.get(file_type, set())
+        allowed_exts = SecureFileValidator.ALLOWED_EXTENSIONS.get(
+            file_type, frozenset()
+        )
         if not allowed_exts:
             return ValidationResult(False, f"Unknown file type: {file_type}")
 
@@ -136,7 +151,11 @@ class SecureFileValidator:
     @staticmethod
     def detect_magic_bytes(content: bytes) -> str:
         """Detect file type from magic bytes."""
-        for magic, mime_type in SecureFileValidator.MAGIC_BYTES.items():
+        # One dict lookup on the prefix; only signatures sharing it are compared
+        candidates = SecureFileValidator._MAGIC_INDEX.get(
+            content[: SecureFileValidator._MAGIC_KEY_LEN], ()
+        )
+        for magic, mime_type in candidates:
             if content.startswith(magic):
                 return mime_type
         return "application/octet-stream"
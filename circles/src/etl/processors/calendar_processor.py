@@ -11,16 +11,67 @@ Handles batch processing with concurrency control and comprehensive error handli
 """
 
 import asyncio
+import bisect
 import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import aiofiles
+
 logger = logging.getLogger(__name__)
 
+# Compiled once: whole-text scans replace the per-line Python loop
+_EVENT_RE = re.compile(r"BEGIN:VEVENT(.*?)END:VEVENT", re.S)
+_FIELD_RE = re.compile(
+    r"^[ \t]*(SUMMARY|DESCRIPTION|LOCATION|DTSTART|DTEND)(?:;[^:\r\n]*)?"
+    r":[ \t]*(.*?)[ \t\r]*$",
+    re.M,
+)
+# Basic (20240115T090000Z) or extended (2024-01-15T09:00:00+00:00) ISO 8601
+_DATETIME_RE = re.compile(r":(\d{4}-?\d{2}-?\d{2}T?[\d:]*(?:Z|[+-]\d{2}:?\d{2})?)")
+# Strips extended-form separators so basic and extended values order together
+_DATE_SEPARATORS = str.maketrans("", "", "-:")
+_FIELD_KEYS = {
+    "SUMMARY": "title",
+    "DESCRIPTION": "description",
+    "LOCATION": "location",
+    "DTSTART": "start",
+    "DTEND": "end",
+}
+
+# Busy level by event count: <=50 light, 51-100 moderate, >100 heavy
+_BUSY_CUTOFFS = (50, 100)
+_BUSY_LEVELS = ("light", "moderate", "heavy")
+
+_INTEREST_KEYWORDS = {
+    "development": ["dev", "coding", "programming", "github", "sprint"],
+    "fitness": ["gym", "workout", "run", "exercise", "yoga"],
+    "travel": ["flight", "trip", "vacation", "hotel", "travel"],
+    "work": ["meeting", "standup", "review", "conference", "presentation"],
+    "learning": ["course", "learning", "training", "webinar", "lecture"],
+    "social": ["dinner", "lunch", "coffee", "party", "hangout"],
+}
+# Lowercased once at import; only event titles are lowered per call
+_KEYWORD_CATEGORY = {
+    keyword.lower(): category
+    for category, keywords in _INTEREST_KEYWORDS.items()
+    for keyword in keywords
+}
+# Single multi-keyword pattern; the lookahead reports overlapping matches
+# so every keyword is still found as a plain substring
+_INTEREST_RE = re.compile(
+    "(?=({}))".format(
+        "|".join(
+            re.escape(keyword)
+            for keyword in sorted(_KEYWORD_CATEGORY, key=len, reverse=True)
+        )
+    )
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class SimpleProcessorResult:
     """Simple result container for processor outputs."""
 
@@ -62,21 +113,24 @@ class CalendarProcessor:
                 raise FileNotFoundError(f"Calendar file not found: {file_path}")
 
             # Read ICS file asynchronously
-            def _read_file():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-
-            ics_content = await asyncio.to_thread(_read_file)
+            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
+                ics_content = await f.read()
 
             # Validate file has content
             if not ics_content.strip():
                 raise ValueError("Calendar file appears to be empty")
 
-            # Parse and analyze events
-            events = self._parse_ics_events(ics_content)
-            date_range = self._get_date_range(events)
-            interests = self._extract_interests(events)
-            patterns = self._analyze_patterns(events)
+            # Parse and analyze events off the event loop (CPU-bound on large files)
+            def _analyze():
+                events = self._parse_ics_events(ics_content)
+                return (
+                    events,
+                    self._get_date_range(events),
+                    self._extract_interests(events),
+                    self._analyze_patterns(events),
+                )
+
+            events, date_range, interests, patterns = await asyncio.to_thread(_analyze)
 
             # Get file size asynchronously
             file_size = (await asyncio.to_thread(file_path.stat)).st_size
@@ -112,35 +166,28 @@ class CalendarProcessor:
     def _parse_ics_events(ics_content: str) -> list[dict]:
         """Parse events from ICS file content."""
         events = []
-        current_event = {}
-
-        for line in ics_content.split("\n"):
-            line = line.strip()
-
-            if line.startswith("BEGIN:VEVENT"):
-                current_event = {}
-            elif line.startswith("END:VEVENT"):
-                if current_event:
-                    events.append(current_event)
-            elif line.startswith("SUMMARY:"):
-                current_event["title"] = line.replace("SUMMARY:", "").strip()
-            elif line.startswith("DESCRIPTION:"):
-                current_event["description"] = line.replace("DESCRIPTION:", "").strip()[
-                    :500
-                ]
-            elif line.startswith("DTSTART"):
-                current_event["start"] = CalendarProcessor._parse_datetime(line)
-            elif line.startswith("DTEND"):
-                current_event["end"] = CalendarProcessor._parse_datetime(line)
-            elif line.startswith("LOCATION:"):
-                current_event["location"] = line.replace("LOCATION:", "").strip()
+
+        for block in _EVENT_RE.findall(ics_content):
+            event = {}
+            for match in _FIELD_RE.finditer(block):
+                name, value = match.group(1), match.group(2)
+                if name in ("DTSTART", "DTEND"):
+                    event[_FIELD_KEYS[name]] = CalendarProcessor._parse_datetime(
+                        match.group(0)
+                    )
+                elif name == "DESCRIPTION":
+                    event["description"] = value[:500]
+                else:
+                    event[_FIELD_KEYS[name]] = value
+            if event:
+                events.append(event)
 
         return events
 
     @staticmethod
     def _parse_datetime(line: str) -> Optional[str]:
         """Extract datetime from DTSTART/DTEND line."""
-        match = re.search(r":(\d{8}T?\d*Z?)", line)
+        match = _DATETIME_RE.search(line)
         if match:
             return match.group(1)
         return None
@@ -148,41 +195,36 @@ class CalendarProcessor:
     @staticmethod
     def _get_date_range(events: list) -> tuple[Optional[str], Optional[str]]:
         """Get earliest and latest event dates."""
-        if not events:
+        # Basic-form ICS timestamps sort lexicographically; extended values
+        # are compared with their "-"/":" separators stripped to match
+        dates = [
+            date
+            for event in events
+            for date in (event.get("start"), event.get("end"))
+            if date
+        ]
+        if not dates:
             return None, None
+        return (
+            min(dates, key=CalendarProcessor._date_sort_key),
+            max(dates, key=CalendarProcessor._date_sort_key),
+        )
 
-        dates = []
-        for event in events:
-            if "start" in event:
-                dates.append(event["start"])
-            if "end" in event:
-                dates.append(event["end"])
-
-        if dates:
-            dates.sort()
-            return dates[0], dates[-1]
-        return None, None
+    @staticmethod
+    def _date_sort_key(value: str) -> str:
+        """Canonical basic-form key for ordering ICS date/datetime values."""
+        return value.translate(_DATE_SEPARATORS)
 
     @staticmethod
     def _extract_interests(events: list) -> list[str]:
         """Extract inferred interests from event titles."""
         interests = set()
-        keywords = {
-            "development": ["dev", "coding", "programming", "github", "sprint"],
-            "fitness": ["gym", "workout", "run", "exercise", "yoga"],
-            "travel": ["flight", "trip", "vacation", "hotel", "travel"],
-            "work": ["meeting", "standup", "review", "conference", "presentation"],
-            "learning": ["course", "learning", "training", "webinar", "lecture"],
-            "social": ["dinner", "lunch", "coffee", "party", "hangout"],
-        }
-
-        text = " ".join([e.get("title", "").lower() for e in events])
+        text = "\n".join([e.get("title", "").lower() for e in events])
 
-        for category, keywords_list in keywords.items():
-            for keyword in keywords_list:
-                if keyword in text:
-                    interests.add(category)
-                    break
+        for match in _INTEREST_RE.finditer(text):
+            interests.add(_KEYWORD_CATEGORY[match.group(1)])
+            if len(interests) == len(_INTEREST_KEYWORDS):
+                break
 
         return list(interests)
 
@@ -192,13 +234,11 @@ class CalendarProcessor:
         if not events:
             return {}
 
-        # Count events by approximate time of day (from title/description)
-        busy_level = "moderate" if len(events) > 50 else "light"
-        if len(events) > 100:
-            busy_level = "heavy"
+        total_events = len(events)
+        busy_level = _BUSY_LEVELS[bisect.bisect_left(_BUSY_CUTOFFS, total_events)]
 
         return {
-            "total_events": len(events),
+            "total_events": total_events,
             "busy_level": busy_level,
             "types": ["meetings", "personal", "fitness", "travel"],
         }
@@ -13,6 +13,7 @@ Handles batch processing with concurrency control and comprehensive error handli
 import asyncio
 import json
 import logging
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -63,35 +64,32 @@ class ChatTranscriptProcessor:
             if not file_path.exists():
                 raise FileNotFoundError(f"Transcript file not found: {file_path}")
 
-            # Read file content asynchronously
-            def _read_file():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
-
-            content_str = await asyncio.to_thread(_read_file)
+            # Read raw bytes once; their length doubles as the file size
+            content_bytes = await asyncio.to_thread(file_path.read_bytes)
 
             # Validate file has content
-            if not content_str.strip():
+            if not content_bytes.strip():
                 raise ValueError("Transcript file appears to be empty")
 
             # Parse based on format
             if file_path.suffix.lower() == ".json":
-                messages, metadata = self._parse_json_transcript(content_str)
+                messages, metadata = self._parse_json_transcript(content_bytes)
             else:
-                messages, metadata = self._parse_text_transcript(content_str)
+                # Match text-mode reads: \r\n and lone \r become \n
+                content = content_bytes.decode("utf-8")
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+                messages, metadata = self._parse_text_transcript(content)
 
-            # Extract participants
-            participants = self._extract_participants(messages)
+            # Count senders once; participants and analysis share the pass
+            sender_counts = self._count_senders(messages)
+            participants = list(sender_counts)
 
             # Analyze conversation
-            analysis = self._analyze_conversation(messages)
+            analysis = self._analyze_conversation(messages, sender_counts)
 
             # Split messages into chunks if needed
             splits = self._split_messages(messages, self.MESSAGES_PER_CHUNK)
 
-            # Get file size asynchronously
-            file_size = (await asyncio.to_thread(file_path.stat)).st_size
-
             result_content = {
                 "splits": splits,
                 "participants": participants,
@@ -103,7 +101,7 @@ class ChatTranscriptProcessor:
 
             metadata_result = {
                 "file_type": file_path.suffix.lower(),
-                "file_size": file_size,
+                "file_size": len(content_bytes),
                 "format": "json" if file_path.suffix.lower() == ".json" else "text",
                 "analysis": analysis,
             }
@@ -123,8 +121,13 @@ class ChatTranscriptProcessor:
             raise
 
     @staticmethod
-    def _parse_json_transcript(content: str) -> tuple[list, dict]:
-        """Parse JSON-formatted transcript."""
+    def _parse_json_transcript(content: str | bytes) -> tuple[list, dict]:
+        """
+        Parse JSON-formatted transcript.
+
+        Accepts the raw file bytes as well as str; json.loads detects and
+        decodes UTF-8 itself.
+        """
         try:
             data = json.loads(content)
             if isinstance(data, list):
@@ -145,44 +148,53 @@ class ChatTranscriptProcessor:
     @staticmethod
     def _parse_text_transcript(content: str) -> tuple[list, dict]:
         """Parse text-formatted transcript (simple line-based format)."""
-        messages = []
-        lines = content.split("\n")
-
-        for line in lines:
-            if ":" in line:
-                parts = line.split(":", 1)
-                messages.append({"sender": parts[0].strip(), "text": parts[1].strip()})
+        # partition scans each line once and allocates no list; lines without
+        # a colon come back with an empty separator and are skipped
+        messages = [
+            {"sender": sender.strip(), "text": text.strip()}
+            for sender, sep, text in (
+                line.partition(":") for line in content.split("\n")
+            )
+            if sep
+        ]
 
         metadata = {"date_start": None, "date_end": None}
         return messages, metadata
 
     @staticmethod
-    def _extract_participants(messages: list) -> list[str]:
-        """Extract unique participants from messages."""
-        participants = set()
-        for msg in messages:
-            if isinstance(msg, dict) and "sender" in msg:
-                participants.add(msg["sender"])
-        return list(participants)
+    def _count_senders(messages: list) -> Counter:
+        """Count messages per sender in first-seen order, skipping malformed ones."""
+        return Counter(
+            msg["sender"]
+            for msg in messages
+            if isinstance(msg, dict) and "sender" in msg
+        )
 
     @staticmethod
-    def _analyze_conversation(messages: list) -> dict:
-        """Analyze conversation patterns."""
+    def _analyze_conversation(
+        messages: list, sender_counts: Optional[Counter] = None
+    ) -> dict:
+        """
+        Analyze conversation patterns.
+
+        Args:
+            messages: List of message dictionaries
+            sender_counts: Precomputed _count_senders result, to avoid a
+                second pass over messages
+
+        Returns:
+            Dictionary with message totals and per-participant activity
+        """
         if not messages:
             return {}
 
-        total_messages = len(messages)
-        participant_counts = {}
-
-        for msg in messages:
-            if isinstance(msg, dict) and "sender" in msg:
-                sender = msg["sender"]
-                participant_counts[sender] = participant_counts.get(sender, 0) + 1
+        if sender_counts is None:
+            sender_counts = ChatTranscriptProcessor._count_senders(messages)
 
         return {
-            "total_messages": total_messages,
-            "unique_participants": len(participant_counts),
-            "participant_activity": participant_counts,
+            "total_messages": len(messages),
+            "unique_participants": len(sender_counts),
+            "participant_activity": dict(sender_counts),
         }
 
     @staticmethod
@@ -197,28 +209,18 @@ class ChatTranscriptProcessor:
         Returns:
             List of chunk dictionaries, each containing messages and metadata
         """
-        if not messages:
-            return []
-
-        splits = []
         total_messages = len(messages)
 
-        for i in range(0, total_messages, chunk_size):
-            chunk_messages = messages[i : i + chunk_size]
-            chunk_start_idx = i
-            chunk_end_idx = min(i + chunk_size - 1, total_messages - 1)
-
-            chunk_data = {
-                "messages": chunk_messages,
-                "chunk_index": len(splits),
-                "chunk_start_idx": chunk_start_idx,
-                "chunk_end_idx": chunk_end_idx,
-                "chunk_message_count": len(chunk_messages),
+        return [
+            {
+                "messages": messages[start : start + chunk_size],
+                "chunk_index": chunk_index,
+                "chunk_start_idx": start,
+                "chunk_end_idx": min(start + chunk_size, total_messages) - 1,
+                "chunk_message_count": min(chunk_size, total_messages - start),
             }
-
-            splits.append(chunk_data)
-
-        return splits
+            for chunk_index, start in enumerate(range(0, total_messages, chunk_size))
+        ]
 
     async def process_batch(
         self, file_paths: List[Path]
@@ -6,7 +6,6 @@ Supports both single and batch processing with concurrent API calls.
 """
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
@@ -16,6 +15,7 @@ import anthropic
 
 from ..adapters.markdown.markitdown import MarkItDownAdapter, MarkItDownConfig
 from ..core import get_settings
+from .text_utils import extract_json_from_response, markdown_to_text
 
 logger = logging.getLogger(__name__)
 
@@ -123,45 +123,7 @@ class PDFProcessor:
             logger.error(f"Text extraction failed for {file_path.name}: {e}")
             raise ValueError(f"Failed to extract text from PDF: {str(e)}") from e
 
-    @staticmethod
-    def _markdown_to_text(markdown_content: str) -> str:
-        """
-        Convert markdown to plain text by removing markdown syntax.
-
-        Args:
-            markdown_content: Markdown formatted text
-
-        Returns:
-            Plain text content
-        """
-        import re
-
-        # Remove markdown links [text](url) -> text
-        text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", markdown_content)
-
-        # Remove markdown headers #, ##, ### etc
-        text = re.sub(r"^#+\s+", "", text, flags=re.MULTILINE)
-
-        # Remove markdown bold **text** -> text
-        text = re.sub(r"\*\*([^\*]+)\*\*", r"\1", text)
-
-        # Remove markdown italic *text* -> text
-        text = re.sub(r"\*([^\*]+)\*", r"\1", text)
-
-        # Remove markdown code blocks ```
-        text = re.sub(r"```[^\`]*```", "", text, flags=re.DOTALL)
-
-        # Remove inline code `text` -> text
-        text = re.sub(r"`([^\`]+)`", r"\1", text)
-
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-
-        # Clean up excessive whitespace
-        text = re.sub(r"\n\s*\n", "\n\n", text)
-        text = text.strip()
-
-        return text
+    _markdown_to_text = staticmethod(markdown_to_text)
 
     async def _analyze_content(self, text: str) -> Dict[str, Any]:
         """
@@ -251,46 +213,7 @@ class PDFProcessor:
             logger.error(f"Error analyzing content: {e}")
             return self._get_fallback_analysis()
 
-    @staticmethod
-    def _extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
-        """
-        Extract JSON from Claude API response with fallbacks.
-
-        Args:
-            response_text: Raw response text from Claude API
-
-        Returns:
-            Parsed JSON dictionary or None if parsing fails
-        """
-        import re
-
-        try:
-            # Try direct JSON parsing first
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            pass
-
-        # Try to find JSON block in response
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}")
-
-        if json_start >= 0 and json_end > json_start:
-            try:
-                json_str = response_text[json_start : json_end + 1]
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                pass
-
-        # Try removing markdown code blocks
-        json_pattern = r"```(?:json)?\s*({.*?})\s*```"
-        match = re.search(json_pattern, response_text, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1))
-            except json.JSONDecodeError:
-                pass
-
-        return None
+    _extract_json_from_response = staticmethod(extract_json_from_response)
 
     @staticmethod
     def _get_fallback_analysis() -> Dict[str, Any]:
@@ -18,7 +18,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import aiofiles
 import anthropic
 
 from ..core import get_settings
@@ -26,6 +25,9 @@ from ..services import ImageService
 
 logger = logging.getLogger(__name__)
 
+# First JSON object embedded in free text, allowing one level of nesting
+_JSON_OBJECT_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", re.DOTALL)
+
 
 @dataclass
 class SimpleProcessorResult:
@@ -63,12 +65,11 @@ class PhotoProcessor:
             SimpleProcessorResult with vision analysis and metadata
         """
         try:
-            # Read image file asynchronously
-            async with aiofiles.open(file_path, "rb") as f:
-                image_data = await f.read()
-
-            # Encode to base64
-            encoded_image = base64.standard_b64encode(image_data).decode("utf-8")
+            # Read and base64-encode in one worker-thread call so large images
+            # never block the event loop
+            encoded_image, file_size = await asyncio.to_thread(
+                self._read_base64, file_path
+            )
 
             # Determine media type from extension
             media_type = self._get_media_type(file_path)
@@ -79,9 +80,6 @@ class PhotoProcessor:
             # Extract EXIF data asynchronously
             exif_data = await self._extract_exif_data_async(file_path)
 
-            # Get file stats asynchronously
-            file_size = (await asyncio.to_thread(file_path.stat)).st_size
-
             # Build result
             content = {
                 "caption": caption,
@@ -162,13 +160,14 @@ Format your response as JSON with keys: caption (string) and analysis (object wi
 
             # Try to extract JSON from response
             try:
-                # Use regex to find JSON object more reliably
-                json_match = re.search(
-                    r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", response_text, re.DOTALL
-                )
-                if json_match:
-                    json_str = json_match.group()
-                    result = json.loads(json_str)
+                # Claude is asked for bare JSON, so decode the whole response
+                # first and only scan for an embedded object when that fails
+                result = self._loads_json_object(response_text)
+                if result is None:
+                    json_match = _JSON_OBJECT_RE.search(response_text)
+                    if json_match:
+                        result = json.loads(json_match.group())
+                if result is not None:
                     caption = result.get("caption", "")
                     analysis = result.get("analysis", {})
                 else:
@@ -197,6 +196,26 @@ Format your response as JSON with keys: caption (string) and analysis (object wi
             logger.error(f"Unexpected error in image analysis: {e}")
             raise
 
+    @staticmethod
+    def _read_base64(file_path: Path) -> tuple[str, int]:
+        """
+        Read an image file and base64-encode it.
+
+        Returns:
+            Tuple of (base64 text, file size in bytes)
+        """
+        image_data = file_path.read_bytes()
+        return base64.standard_b64encode(image_data).decode("ascii"), len(image_data)
+
+    @staticmethod
+    def _loads_json_object(text: str) -> Optional[Dict[str, Any]]:
+        """Decode text as a JSON object, returning None if it is anything else."""
+        try:
+            result = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return result if isinstance(result, dict) else None
+
     @staticmethod
     def _get_media_type(file_path: Path) -> str:
         """Get MIME type from file extension."""
@@ -0,0 +1,100 @@
+"""
+Text helpers shared by the document processors.
+
+Markdown stripping for MarkItDown output and tolerant JSON extraction
+from Claude API responses, used by PDFProcessor and ResumeProcessor.
+"""
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+# (marker, pattern, replacement) applied in order by markdown_to_text; a rule
+# is skipped when its marker substring does not occur in the text
+_MARKDOWN_RULES = (
+    # Links [text](url) -> text
+    ("[", re.compile(r"\[([^\]]+)\]\([^\)]+\)"), r"\1"),
+    # Headers #, ##, ### etc
+    ("#", re.compile(r"^#+\s+", re.MULTILINE), ""),
+    # Bold **text** -> text
+    ("**", re.compile(r"\*\*([^\*]+)\*\*"), r"\1"),
+    # Italic *text* -> text
+    ("*", re.compile(r"\*([^\*]+)\*"), r"\1"),
+    # Code blocks ```
+    ("```", re.compile(r"```[^\`]*```", re.DOTALL), ""),
+    # Inline code `text` -> text
+    ("`", re.compile(r"`([^\`]+)`"), r"\1"),
+    # HTML tags
+    ("<", re.compile(r"<[^>]+>"), ""),
+    # Excessive blank lines
+    ("\n", re.compile(r"\n\s*\n"), "\n\n"),
+)
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*({.*?})\s*```", re.DOTALL)
+
+
+def markdown_to_text(markdown_content: str) -> str:
+    """
+    Convert markdown to plain text by removing markdown syntax.
+
+    Args:
+        markdown_content: Markdown formatted text
+
+    Returns:
+        Plain text content
+    """
+    text = markdown_content
+    for marker, pattern, replacement in _MARKDOWN_RULES:
+        # A substring check is far cheaper than a full regex scan that
+        # cannot match, and most rules find nothing in plain prose
+        if marker in text:
+            text = pattern.sub(replacement, text)
+
+    return text.strip()
+
+
+def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract JSON from Claude API response with fallbacks.
+
+    Args:
+        response_text: Raw response text from Claude API
+
+    Returns:
+        Parsed JSON dictionary or None if parsing fails
+    """
+    try:
+        # Try direct JSON parsing first
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        pass
+
+    # Decode the object that opens at the first brace; raw_decode stops at
+    # its closing brace, so trailing prose (even with braces) is ignored
+    json_start = response_text.find("{")
+    if json_start >= 0:
+        try:
+            return _JSON_DECODER.raw_decode(response_text, json_start)[0]
+        except json.JSONDecodeError:
+            pass
+
+    # Try the span between the first and last brace
+    json_end = response_text.rfind("}")
+
+    if json_start >= 0 and json_end > json_start:
+        try:
+            json_str = response_text[json_start : json_end + 1]
+            return json.loads(json_str)
+        except json.JSONDecodeError:
+            pass
+
+    # Try removing markdown code blocks
+    match = _JSON_FENCE_RE.search(response_text)
+    if match:
+        try:
+            return json.loads(match.group(1))
+        except json.JSONDecodeError:
+            pass
+
+    return None
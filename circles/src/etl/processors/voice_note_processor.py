@@ -12,17 +12,145 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import aiofiles
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from ..core import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Peak level below which a recording is treated as silent and not transcribed
+_SILENCE_THRESHOLD_DBFS = -50.0
+
+# Whisper's verbose_json reports full language names; voice_notes.language
+# stores ISO-639-1 codes. Languages without a two-letter code map to "unknown".
+_WHISPER_LANGUAGE_CODES = {
+    "english": "en",
+    "chinese": "zh",
+    "german": "de",
+    "spanish": "es",
+    "russian": "ru",
+    "korean": "ko",
+    "french": "fr",
+    "japanese": "ja",
+    "portuguese": "pt",
+    "turkish": "tr",
+    "polish": "pl",
+    "catalan": "ca",
+    "dutch": "nl",
+    "arabic": "ar",
+    "swedish": "sv",
+    "italian": "it",
+    "indonesian": "id",
+    "hindi": "hi",
+    "finnish": "fi",
+    "vietnamese": "vi",
+    "hebrew": "he",
+    "ukrainian": "uk",
+    "greek": "el",
+    "malay": "ms",
+    "czech": "cs",
+    "romanian": "ro",
+    "danish": "da",
+    "hungarian": "hu",
+    "tamil": "ta",
+    "norwegian": "no",
+    "thai": "th",
+    "urdu": "ur",
+    "croatian": "hr",
+    "bulgarian": "bg",
+    "lithuanian": "lt",
+    "latin": "la",
+    "maori": "mi",
+    "malayalam": "ml",
+    "welsh": "cy",
+    "slovak": "sk",
+    "telugu": "te",
+    "persian": "fa",
+    "latvian": "lv",
+    "bengali": "bn",
+    "serbian": "sr",
+    "azerbaijani": "az",
+    "slovenian": "sl",
+    "kannada": "kn",
+    "estonian": "et",
+    "macedonian": "mk",
+    "breton": "br",
+    "basque": "eu",
+    "icelandic": "is",
+    "armenian": "hy",
+    "nepali": "ne",
+    "mongolian": "mn",
+    "bosnian": "bs",
+    "kazakh": "kk",
+    "albanian": "sq",
+    "swahili": "sw",
+    "galician": "gl",
+    "marathi": "mr",
+    "punjabi": "pa",
+    "sinhala": "si",
+    "khmer": "km",
+    "shona": "sn",
+    "yoruba": "yo",
+    "somali": "so",
+    "afrikaans": "af",
+    "occitan": "oc",
+    "georgian": "ka",
+    "belarusian": "be",
+    "tajik": "tg",
+    "sindhi": "sd",
+    "gujarati": "gu",
+    "amharic": "am",
+    "yiddish": "yi",
+    "lao": "lo",
+    "uzbek": "uz",
+    "faroese": "fo",
+    "haitian creole": "ht",
+    "pashto": "ps",
+    "turkmen": "tk",
+    "nynorsk": "nn",
+    "maltese": "mt",
+    "sanskrit": "sa",
+    "luxembourgish": "lb",
+    "myanmar": "my",
+    "tibetan": "bo",
+    "tagalog": "tl",
+    "malagasy": "mg",
+    "assamese": "as",
+    "tatar": "tt",
+    "lingala": "ln",
+    "hausa": "ha",
+    "bashkir": "ba",
+    "javanese": "jv",
+    "sundanese": "su",
+}
+_LANGUAGE_CODES = frozenset(_WHISPER_LANGUAGE_CODES.values())
+
+# Shared Whisper client, reused by every processor on the same event loop so
+# the HTTP connection pool survives across requests. Celery tasks each run
+# their own loop, so a client is rebuilt when the loop changes.
+_whisper_client: Optional[AsyncOpenAI] = None
+_whisper_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_whisper_client() -> AsyncOpenAI:
+    """Return the process-wide AsyncOpenAI client for the current event loop."""
+    global _whisper_client, _whisper_client_loop
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _whisper_client is None or _whisper_client_loop is not loop:
+        settings = get_settings()
+        _whisper_client = AsyncOpenAI(api_key=settings.openai_api_key)
+        _whisper_client_loop = loop
+    return _whisper_client
+
 
-@dataclass
+@dataclass(slots=True)
 class SimpleProcessorResult:
     """Simple result container for processor outputs."""
 
@@ -36,13 +164,12 @@ class VoiceNoteProcessor:
 
     def __init__(self, max_concurrent: int = 3):
         """
-        Initialize processor with OpenAI client.
+        Initialize processor with the shared async OpenAI client.
 
         Args:
             max_concurrent: Maximum concurrent Whisper API calls (default 3, lower due to API rate limits)
         """
-        settings = get_settings()
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = get_whisper_client()
         self.max_concurrent = max_concurrent
         self.semaphore = asyncio.Semaphore(max_concurrent)
 
@@ -57,8 +184,22 @@ class VoiceNoteProcessor:
             SimpleProcessorResult with transcription and metadata
         """
         try:
-            # Transcribe audio
-            transcription_result = await self._transcribe_audio(file_path)
+            # Decode once locally: duration plus a cheap silence check that
+            # saves a Whisper request for recordings with nothing to transcribe
+            probed_duration, is_silent = await asyncio.to_thread(
+                self._probe_audio, file_path
+            )
+
+            if is_silent:
+                logger.info(f"Skipping Whisper for silent audio {file_path.name}")
+                transcription_result = {
+                    "text": "",
+                    "language": "unknown",
+                    "confidence": 0.0,
+                    "segments": [],
+                }
+            else:
+                transcription_result = await self._transcribe_audio(file_path)
 
             # Extract topics from transcription
             topics = self._extract_topics(transcription_result.get("text", ""))
@@ -69,10 +210,16 @@ class VoiceNoteProcessor:
             # Get file stats asynchronously
             file_size = (await asyncio.to_thread(file_path.stat)).st_size
 
+            # Prefer Whisper's reported duration, then the local decode
+            duration = transcription_result.get("duration")
+            if duration is None:
+                duration = probed_duration or 0.0
+
             # Build result
             content = {
                 "transcription": transcription_result.get("text", ""),
                 "language": transcription_result.get("language", "unknown"),
+                "segments": transcription_result.get("segments", []),
                 "topics": topics,
                 "sentiment": sentiment,
             }
@@ -81,7 +228,7 @@ class VoiceNoteProcessor:
                 "file_type": file_path.suffix.lower(),
                 "file_size": file_size,
                 "confidence": transcription_result.get("confidence", 0.0),
-                "duration_seconds": await self._get_audio_duration(file_path),
+                "duration_seconds": duration,
             }
 
             return SimpleProcessorResult(content=content, metadata=metadata)
@@ -94,35 +241,38 @@ class VoiceNoteProcessor:
         """
         Transcribe audio file using Whisper API (non-blocking).
 
+        Uses the verbose_json response so language, timed segments and
+        duration come back with the text in a single request.
+
         Returns:
-            Dict with transcription, language, and confidence
+            Dict with transcription, language, confidence, segments and duration
         """
         try:
-            # Read audio file asynchronously
-            async with aiofiles.open(file_path, "rb") as audio_file:
-                audio_data = await audio_file.read()
-
-            # Define sync function to run in thread pool
-            def _whisper_transcribe():
-                # Create a file-like object from bytes
-                from io import BytesIO
-
-                audio_bytes_file = BytesIO(audio_data)
-                audio_bytes_file.name = file_path.name
-
-                return self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_bytes_file,
+            # Hand the open file to the client so the multipart upload is
+            # streamed from disk instead of buffering the whole recording
+            audio_file = await asyncio.to_thread(open, file_path, "rb")
+            with audio_file:
+                # Native async request; no thread pool slot held while waiting
+                transcript = await self.client.audio.transcriptions.create(
+                    model=get_settings().whisper_model,
+                    file=audio_file,
                     temperature=0,  # More deterministic
+                    response_format="verbose_json",
                 )
 
-            # Run Whisper API in thread pool to avoid blocking
-            transcript = await asyncio.to_thread(_whisper_transcribe)
-
+            language = self._language_code(getattr(transcript, "language", None))
+            duration = getattr(transcript, "duration", None)
             return {
                 "text": transcript.text,
-                "language": getattr(transcript, "language", None) or "unknown",
+                "language": language,
                 "confidence": 0.95,  # Whisper doesn't return explicit confidence
+                "segments": [
+                    {"text": segment.text, "start": segment.start, "end": segment.end}
+                    for segment in getattr(transcript, "segments", None) or []
+                ],
+                "duration": (
+                    float(duration) if isinstance(duration, (int, float)) else None
+                ),
             }
         except Exception as e:
             logger.error(f"Whisper transcription error for {file_path.name}: {e}")
@@ -130,9 +280,21 @@ class VoiceNoteProcessor:
                 "text": "",
                 "language": "unknown",
                 "confidence": 0.0,
+                "segments": [],
+                "duration": None,
                 "error": str(e),
             }
 
+    @staticmethod
+    def _language_code(language: Optional[str]) -> str:
+        """Map a Whisper language name (or code) to its ISO-639-1 code."""
+        if not language:
+            return "unknown"
+        language = language.strip().lower()
+        if language in _LANGUAGE_CODES:
+            return language
+        return _WHISPER_LANGUAGE_CODES.get(language, "unknown")
+
     @staticmethod
     def _extract_topics(text: str) -> list[str]:
         """
@@ -248,26 +410,23 @@ class VoiceNoteProcessor:
         return {"sentiment": sentiment, "score": round(score, 2)}
 
     @staticmethod
-    async def _get_audio_duration(file_path: Path) -> float:
+    def _probe_audio(file_path: Path) -> Tuple[Optional[float], bool]:
         """
-        Get audio file duration in seconds (non-blocking).
+        Decode audio once to get its duration and whether it is silent.
 
-        Returns duration or 0 if unable to determine.
+        Returns:
+            (duration in seconds, is_silent), or (None, False) if the file
+            can't be decoded, in which case Whisper gets to decide
         """
+        try:
+            from pydub import AudioSegment
 
-        def _get_duration():
-            try:
-                from pydub import AudioSegment
-
-                audio = AudioSegment.from_file(file_path)
-                return len(audio) / 1000.0  # Convert milliseconds to seconds
-            except Exception as e:
-                logger.debug(f"Could not determine audio duration: {e}")
-                # Unable to determine duration
-                return 0.0
-
-        # Run audio duration detection in thread pool
-        return await asyncio.to_thread(_get_duration)
+            audio = AudioSegment.from_file(file_path)
+            duration = len(audio) / 1000.0  # Convert milliseconds to seconds
+            return duration, audio.max_dBFS < _SILENCE_THRESHOLD_DBFS
+        except Exception as e:
+            logger.debug(f"Could not decode audio: {e}")
+            return None, False
 
     async def process_batch(
         self, file_paths: List[Path]
@@ -2,5 +2,6 @@
 
 from .base_repository import BaseRepository
 from .photo_repository import PhotoRepository
+from .voice_note_repository import VoiceNoteRepository
 
-__all__ = ["BaseRepository", "PhotoRepository"]
+__all__ = ["BaseRepository", "PhotoRepository", "VoiceNoteRepository"]
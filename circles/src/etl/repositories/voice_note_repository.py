@@ -0,0 +1,71 @@
+"""
+Voice Note Repository - Specialized repository for VoiceNote model operations.
+
+Extends BaseRepository with voice-note batch operations.
+"""
+
+from typing import Any, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import VoiceNote
+from .base_repository import BaseRepository
+
+
+class VoiceNoteRepository(BaseRepository[VoiceNote]):
+    """
+    Repository for VoiceNote model operations.
+
+    Provides batch creation from processor results with automatic
+    user_id scoping.
+    """
+
+    def __init__(self):
+        """Initialize VoiceNoteRepository."""
+        super().__init__(VoiceNote)
+
+    async def create_batch_from_processor_results(
+        self,
+        user_id: int,
+        source_id: Optional[int],
+        processor_results: List[Any],
+        session: AsyncSession,
+    ) -> List[VoiceNote]:
+        """
+        Create multiple voice note records efficiently from processor results.
+
+        Optimized for batch processing with minimal database round-trips.
+
+        Args:
+            user_id: User ID
+            source_id: Optional source ID (shared for batch)
+            processor_results: List of processor outputs
+            session: Database session
+
+        Returns:
+            List of created voice note records
+        """
+        records = []
+        for processor_result in processor_results:
+            # Extract transcription and analysis
+            content = processor_result.content
+            metadata = processor_result.metadata or {}
+
+            voice_note_data = {
+                "source_id": source_id,
+                "audio_file": {
+                    "filename": "audio_file",
+                    "size": metadata.get("file_size", 0),
+                    "type": metadata.get("file_type", ""),
+                },
+                "transcription": content.get("transcription", ""),
+                "transcription_confidence": metadata.get("confidence", 0.0),
+                "language": content.get("language", "unknown"),
+                "extracted_topics": content.get("topics", []),
+                "sentiment": content.get(
+                    "sentiment", {"sentiment": "neutral", "score": 0.5}
+                ),
+            }
+            records.append(voice_note_data)
+
+        return await self.create_batch(user_id, records, session)
@@ -15,6 +15,7 @@ Fixtures are organized into sections:
 8. Marker Configuration
 """
 
+import asyncio
 import tempfile
 from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
@@ -69,12 +70,34 @@ try:
 except ImportError:
     Celery = None
 
+try:
+    import uvloop
+except ImportError:  # uvloop is POSIX-only
+    uvloop = None
+
 # Load test settings
 from tests.config.test_settings import get_test_settings
 
 test_settings = get_test_settings()
 
 
+# ============================================================================
+# Event Loop Configuration
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    Use uvloop for async tests when it is installed.
+
+    Falls back to the default asyncio policy on platforms without uvloop.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 # ============================================================================
 # Test Database Configuration (Async)
 # ============================================================================
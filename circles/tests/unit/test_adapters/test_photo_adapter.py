@@ -5,21 +5,34 @@ Tests the 4-phase pipeline (Validate, Process, Persist, Cleanup) for photo proce
 """
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 from src.etl.adapters.base import AdapterContext, DataType
 from src.etl.adapters.photo_adapter import PhotoAdapter
 from src.etl.core import ProcessingError, Result
 
+# Minimal JPEG magic bytes
+_JPEG_MAGIC = b"\xff\xd8\xff\xe0"
+_DUMMY = b"dummy image content"
+
+
+def _mk_fake_session() -> MagicMock:
+    """Build a minimal session stub exposing only what the adapter touches."""
+    session = MagicMock()
+    session.add = MagicMock()
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
 
 @pytest.mark.unit
 class TestPhotoAdapter:
     """Test PhotoAdapter functionality."""
 
     @pytest.fixture
-    async def photo_adapter(self):
+    def photo_adapter(self):
         """Create a PhotoAdapter instance."""
         return PhotoAdapter()
 
@@ -27,8 +40,7 @@ class TestPhotoAdapter:
     def sample_photo_file(self, tmp_path):
         """Create a temporary photo file."""
         photo_path = tmp_path / "test_photo.jpg"
-        # Minimal JPEG magic bytes
-        photo_path.write_bytes(b"\xff\xd8\xff\xe0")
+        photo_path.write_bytes(_JPEG_MAGIC)
         return photo_path
 
     @pytest.fixture
@@ -39,7 +51,7 @@ class TestPhotoAdapter:
             source_id=1,
             data_type=DataType.PHOTO,
             input_path=sample_photo_file,
-            session=AsyncMock(spec=AsyncSession),
+            session=_mk_fake_session(),
         )
 
     @pytest.mark.asyncio
@@ -77,7 +89,7 @@ class TestPhotoAdapter:
 
         for ext in supported_formats:
             test_file = tmp_path / f"photo{ext}"
-            test_file.write_bytes(b"dummy image content")
+            test_file.write_bytes(_DUMMY)
             context = AdapterContext(user_id=1, source_id=1, data_type=DataType.PHOTO)
 
             result = await photo_adapter.validate_input(test_file, context)
@@ -85,11 +97,9 @@ class TestPhotoAdapter:
             assert result.is_ok, f"{ext} should be a valid photo format"
 
     @pytest.mark.asyncio
-    async def test_process_photo(
-        self, photo_adapter, sample_photo_file, mock_adapter_context
-    ):
+    async def test_process_photo(self, sample_photo_file, mock_adapter_context):
         """Test processing a photo file."""
-        mock_processor_result = MagicMock(
+        mock_processor_result = SimpleNamespace(
             content={
                 "caption": "A test image",
                 "analysis": {"objects": ["test"]},
@@ -99,45 +109,40 @@ class TestPhotoAdapter:
             embeddings=None,
         )
 
-        with patch("src.etl.adapters.photo_adapter.PhotoProcessor") as MockProcessor:
-            mock_instance = MockProcessor.return_value
-            mock_instance.process = AsyncMock(return_value=mock_processor_result)
+        stub = SimpleNamespace(process=AsyncMock(return_value=mock_processor_result))
+        adapter = PhotoAdapter(processor=stub)
 
-            result = await photo_adapter.process(
-                sample_photo_file, mock_adapter_context
-            )
+        result = await adapter.process(sample_photo_file, mock_adapter_context)
 
-            assert result.is_ok, "Processing should succeed"
-            assert "caption" in result.value.content
-            assert result.value.metadata["file_type"] == ".jpg"
+        assert result.is_ok, "Processing should succeed"
+        assert "caption" in result.value.content
+        assert result.value.metadata["file_type"] == ".jpg"
+        stub.process.assert_awaited_once_with(sample_photo_file)
 
     @pytest.mark.asyncio
     async def test_process_photo_processor_error(
-        self, photo_adapter, sample_photo_file, mock_adapter_context
+        self, sample_photo_file, mock_adapter_context
     ):
         """Test handling of processor errors."""
-        with patch("src.etl.adapters.photo_adapter.PhotoProcessor") as MockProcessor:
-            mock_instance = MockProcessor.return_value
-            mock_instance.process = AsyncMock(
-                side_effect=ValueError("Vision API error")
-            )
+        stub = SimpleNamespace(
+            process=AsyncMock(side_effect=ValueError("Vision API error"))
+        )
+        adapter = PhotoAdapter(processor=stub)
 
-            result = await photo_adapter.process(
-                sample_photo_file, mock_adapter_context
-            )
+        result = await adapter.process(sample_photo_file, mock_adapter_context)
 
-            assert result.is_error, "Processing should fail and return error Result"
-            assert "Vision API error" in str(result.error_value)
+        assert result.is_error, "Processing should fail and return error Result"
+        assert "Vision API error" in str(result.error_value)
 
     @pytest.mark.asyncio
     async def test_persist_photo_data(self, photo_adapter, mock_adapter_context):
         """Test persisting processed photo data."""
-        processor_result = MagicMock(
+        processor_result = SimpleNamespace(
             content={"caption": "A test image", "analysis": {}},
             metadata={"file_type": ".jpg"},
         )
 
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = _mk_fake_session()
         result = await photo_adapter.persist(
             processor_result, mock_adapter_context, mock_session
         )
@@ -162,35 +167,29 @@ class TestPhotoAdapter:
         self, photo_adapter, sample_photo_file, mock_adapter_context
     ):
         """Test the complete 4-phase pipeline."""
-        mock_processor_result = MagicMock(
+        mock_processor_result = SimpleNamespace(
             content={"caption": "Test image"},
             metadata={"file_type": ".jpg"},
         )
         mock_photo_data = MagicMock()
+        mock_persist = AsyncMock(return_value=Result.ok(mock_photo_data))
+        mock_cleanup = AsyncMock()
+
+        with patch.multiple(
+            photo_adapter,
+            validate_input=AsyncMock(return_value=Result.ok(None)),
+            process=AsyncMock(return_value=Result.ok(mock_processor_result)),
+            persist=mock_persist,
+            cleanup=mock_cleanup,
+        ):
+            mock_session = _mk_fake_session()
+            result = await photo_adapter.execute(
+                sample_photo_file, mock_adapter_context, mock_session
+            )
 
-        with patch.object(
-            photo_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.ok(None)
-            with patch.object(
-                photo_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_process.return_value = Result.ok(mock_processor_result)
-                with patch.object(
-                    photo_adapter, "persist", new_callable=AsyncMock
-                ) as mock_persist:
-                    mock_persist.return_value = Result.ok(mock_photo_data)
-                    with patch.object(
-                        photo_adapter, "cleanup", new_callable=AsyncMock
-                    ) as mock_cleanup:
-                        mock_session = AsyncMock(spec=AsyncSession)
-                        result = await photo_adapter.execute(
-                            sample_photo_file, mock_adapter_context, mock_session
-                        )
-
-                        assert result.is_ok, "Execute should succeed"
-                        mock_persist.assert_called_once()
-                        mock_cleanup.assert_called_once()
+            assert result.is_ok, "Execute should succeed"
+            mock_persist.assert_called_once()
+            mock_cleanup.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_validation_failure(
@@ -201,30 +200,30 @@ class TestPhotoAdapter:
             "Validation failed", error_type="validation_error"
         )
 
-        with patch.object(
-            photo_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.error(validation_error)
-            with patch.object(
-                photo_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_session = AsyncMock(spec=AsyncSession)
-                result = await photo_adapter.execute(
-                    sample_photo_file, mock_adapter_context, mock_session
-                )
-
-                assert result.is_error, "Execute should fail at validation"
-                mock_process.assert_not_called()
+        mock_process = AsyncMock()
+
+        with patch.multiple(
+            photo_adapter,
+            validate_input=AsyncMock(return_value=Result.error(validation_error)),
+            process=mock_process,
+        ):
+            mock_session = _mk_fake_session()
+            result = await photo_adapter.execute(
+                sample_photo_file, mock_adapter_context, mock_session
+            )
+
+            assert result.is_error, "Execute should fail at validation"
+            mock_process.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_exif_data_extraction(self, photo_adapter, mock_adapter_context):
         """Test that EXIF data is extracted during processing."""
-        processor_result = MagicMock(
+        processor_result = SimpleNamespace(
             content={"caption": "Photo with EXIF"},
             metadata={"file_type": ".jpg", "exif_data": {"camera": "Canon"}},
         )
 
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = _mk_fake_session()
         result = await photo_adapter.persist(
             processor_result, mock_adapter_context, mock_session
         )
@@ -237,7 +236,7 @@ class TestPhotoAdapter:
         """Test processing of large photo file."""
         large_file = tmp_path / "large_photo.jpg"
         # Create a 10MB file
-        large_content = b"\xff\xd8\xff\xe0" + (b"x" * (10 * 1024 * 1024 - 4))
+        large_content = _JPEG_MAGIC + (b"x" * (10 * 1024 * 1024 - len(_JPEG_MAGIC)))
         large_file.write_bytes(large_content)
 
         context = AdapterContext(user_id=1, source_id=1, data_type=DataType.PHOTO)
@@ -266,28 +265,23 @@ class TestPhotoAdapter:
         self, photo_adapter, sample_photo_file, mock_adapter_context
     ):
         """Test that context is passed correctly through all phases."""
-        mock_processor_result = MagicMock(content={}, metadata={})
+        mock_processor_result = SimpleNamespace(content={}, metadata={})
         mock_photo_data = MagicMock()
+        mock_process = AsyncMock(return_value=Result.ok(mock_processor_result))
+
+        with patch.multiple(
+            photo_adapter,
+            validate_input=AsyncMock(return_value=Result.ok(None)),
+            process=mock_process,
+            persist=AsyncMock(return_value=Result.ok(mock_photo_data)),
+            cleanup=AsyncMock(),
+        ):
+            mock_session = _mk_fake_session()
+            await photo_adapter.execute(
+                sample_photo_file, mock_adapter_context, mock_session
+            )
 
-        with patch.object(
-            photo_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.ok(None)
-            with patch.object(
-                photo_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_process.return_value = Result.ok(mock_processor_result)
-                with patch.object(
-                    photo_adapter, "persist", new_callable=AsyncMock
-                ) as mock_persist:
-                    mock_persist.return_value = Result.ok(mock_photo_data)
-                    with patch.object(photo_adapter, "cleanup", new_callable=AsyncMock):
-                        mock_session = AsyncMock(spec=AsyncSession)
-                        await photo_adapter.execute(
-                            sample_photo_file, mock_adapter_context, mock_session
-                        )
-
-                        # Verify process received input_data and context
-                        mock_process.assert_called_once_with(
-                            sample_photo_file, mock_adapter_context
-                        )
+            # Verify process received input_data and context
+            mock_process.assert_called_once_with(
+                sample_photo_file, mock_adapter_context
+            )
@@ -4,23 +4,62 @@ Unit tests for VoiceNoteAdapter.
 Tests the 4-phase pipeline (Validate, Process, Persist, Cleanup) for voice note processing.
 """
 
-from pathlib import Path
+import hashlib
+import mmap
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.etl.adapters import voice_note_adapter as voice_note_adapter_module
 from src.etl.adapters.base import AdapterContext, DataType
 from src.etl.adapters.voice_note_adapter import VoiceNoteAdapter
-from src.etl.core import ProcessingError, Result
+from src.etl.core import ProcessingError, Result, ValidationResult
+from src.etl.processors.voice_note_processor import SimpleProcessorResult
+
+SUPPORTED_FORMATS = [".mp3", ".wav", ".ogg", ".webm", ".m4a"]
+
+# Read-only processor result pieces shared across tests
+_EMPTY = MappingProxyType({})
+_MP3_META = MappingProxyType({"file_type": ".mp3"})
+_SILENT_CONTENT = MappingProxyType({"transcription": "", "segments": ()})
+
+
+def _mk_fake_session() -> MagicMock:
+    """Build a minimal session stub exposing only what the adapter touches."""
+    session = MagicMock()
+    session.add = MagicMock()
+    session.add_all = MagicMock()
+    session.flush = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    return session
+
+
+@pytest.fixture(scope="session")
+def large_voice_file(tmp_path_factory):
+    """Create a sparse 100MB voice file once per session; tests must only read it."""
+    large_file = tmp_path_factory.mktemp("voice_data") / "large_note.mp3"
+    with open(large_file, "wb") as f:
+        f.write(b"ID3")
+        f.truncate(100 * 1024 * 1024)  # Extends without writing zero pages
+    return large_file
 
 
 @pytest.mark.unit
 class TestVoiceNoteAdapter:
     """Test VoiceNoteAdapter functionality."""
 
-    @pytest.fixture
-    async def voice_adapter(self):
-        """Create a VoiceNoteAdapter instance."""
+    @pytest.fixture(autouse=True)
+    def clear_transcription_cache(self):
+        """Keep cached transcriptions from leaking between tests."""
+        voice_note_adapter_module._transcription_cache.clear()
+        yield
+        voice_note_adapter_module._transcription_cache.clear()
+
+    @pytest.fixture(scope="session")
+    def voice_adapter(self):
+        """Create a VoiceNoteAdapter shared by the session; patches restore on exit."""
         return VoiceNoteAdapter()
 
     @pytest.fixture
@@ -31,6 +70,29 @@ class TestVoiceNoteAdapter:
         voice_path.write_bytes(b"ID3")
         return voice_path
 
+    @pytest.fixture
+    def oversized_voice_file(self, tmp_path):
+        """Create a sparse voice note file larger than the size limit."""
+        oversized = tmp_path / "oversized.mp3"
+        with open(oversized, "wb") as f:
+            f.truncate(51 * 1024 * 1024)  # Sparse file, no data written
+        return oversized
+
+    @pytest.fixture(autouse=True)
+    def mock_processor_cls(self):
+        """Patch VoiceNoteProcessor so no test can reach the Whisper API."""
+        with patch(
+            "src.etl.adapters.voice_note_adapter.VoiceNoteProcessor"
+        ) as mock_cls:
+            mock_cls.return_value.process = AsyncMock()
+            mock_cls.return_value.process_batch = AsyncMock()
+            yield mock_cls
+
+    @pytest.fixture
+    def base_context(self):
+        """Create a plain voice note AdapterContext for validation tests."""
+        return AdapterContext(user_id=1, source_id=1, data_type=DataType.VOICE_NOTE)
+
     @pytest.fixture
     def mock_adapter_context(self, sample_voice_file):
         """Create a mock AdapterContext."""
@@ -39,59 +101,106 @@ class TestVoiceNoteAdapter:
             source_id=1,
             data_type=DataType.VOICE_NOTE,
             input_path=sample_voice_file,
-            session=AsyncMock(spec=AsyncSession),
+            session=_mk_fake_session(),
         )
 
     @pytest.mark.asyncio
-    async def test_validate_input_valid_voice(self, voice_adapter, sample_voice_file):
+    async def test_validate_input_valid_voice(
+        self, voice_adapter, base_context, sample_voice_file
+    ):
         """Test validation of a valid voice note file."""
-        context = AdapterContext(user_id=1, source_id=1, data_type=DataType.VOICE_NOTE)
-        result = await voice_adapter.validate_input(sample_voice_file, context)
+        result = await voice_adapter.validate_input(sample_voice_file, base_context)
 
         assert result.is_ok, "Valid voice file should pass validation"
 
     @pytest.mark.asyncio
-    async def test_validate_input_nonexistent_file(self, voice_adapter, tmp_path):
+    async def test_validate_input_nonexistent_file(
+        self, voice_adapter, base_context, tmp_path
+    ):
         """Test validation of non-existent file."""
         non_existent = tmp_path / "nonexistent.mp3"
-        context = AdapterContext(user_id=1, source_id=1, data_type=DataType.VOICE_NOTE)
 
-        result = await voice_adapter.validate_input(non_existent, context)
+        result = await voice_adapter.validate_input(non_existent, base_context)
         assert result.is_error, "Non-existent file should fail validation"
 
     @pytest.mark.asyncio
-    async def test_validate_input_invalid_extension(self, voice_adapter, tmp_path):
+    async def test_validate_input_invalid_extension(
+        self, voice_adapter, base_context, tmp_path
+    ):
         """Test validation of unsupported file type."""
         invalid_file = tmp_path / "note.txt"
         invalid_file.write_text("content")
 
-        context = AdapterContext(user_id=1, source_id=1, data_type=DataType.VOICE_NOTE)
-        result = await voice_adapter.validate_input(invalid_file, context)
+        result = await voice_adapter.validate_input(invalid_file, base_context)
 
         assert result.is_error, "Invalid file extension should fail validation"
 
     @pytest.mark.asyncio
-    async def test_validate_input_supported_formats(self, voice_adapter, tmp_path):
+    async def test_validate_input_extension_checked_before_io(
+        self, voice_adapter, base_context, tmp_path
+    ):
+        """Test that unsupported extensions are rejected without touching disk."""
+        missing_file = tmp_path / "missing.txt"
+
+        result = await voice_adapter.validate_input(missing_file, base_context)
+
+        assert result.is_error
+        assert result.error_value.error_type == "validation_error"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ext", SUPPORTED_FORMATS)
+    async def test_validate_input_supported_formats(
+        self, voice_adapter, base_context, tmp_path, ext
+    ):
         """Test validation of all supported audio formats."""
-        supported_formats = [".mp3", ".wav", ".ogg", ".webm", ".m4a"]
+        test_file = tmp_path / f"note{ext}"
+        test_file.write_bytes(b"dummy audio content")
 
-        for ext in supported_formats:
-            test_file = tmp_path / f"note{ext}"
-            test_file.write_bytes(b"dummy audio content")
+        result = await voice_adapter.validate_input(test_file, base_context)
+
+        assert result.is_ok, f"{ext} should be a valid audio format"
+
+    @pytest.mark.asyncio
+    async def test_validate_reads_only_header_bytes(
+        self, voice_adapter, base_context, tmp_path
+    ):
+        """Test that validation sniffs a fixed-size header, not the whole file."""
+        audio_file = tmp_path / "note.mp3"
+        audio_file.write_bytes(b"ID3" + b"\x00" * (1024 * 1024))
+
+        with patch(
+            "src.etl.adapters.voice_note_adapter.SecureFileValidator.validate_file",
+            new_callable=AsyncMock,
+            return_value=ValidationResult(True),
+        ) as mock_validate:
+            result = await voice_adapter.validate_input(audio_file, base_context)
 
-            context = AdapterContext(
-                user_id=1, source_id=1, data_type=DataType.VOICE_NOTE
+        assert result.is_ok
+        assert mock_validate.await_args.kwargs["content"] == b"ID3" + b"\x00" * 13
+
+    @pytest.mark.asyncio
+    async def test_validate_rejects_oversized_file_before_reading(
+        self, voice_adapter, base_context, oversized_voice_file
+    ):
+        """Test that oversized files fail on stat size without being read."""
+        with patch(
+            "src.etl.adapters.voice_note_adapter.SecureFileValidator.validate_file",
+            new_callable=AsyncMock,
+        ) as mock_validate:
+            result = await voice_adapter.validate_input(
+                oversized_voice_file, base_context
             )
-            result = await voice_adapter.validate_input(test_file, context)
 
-            assert result.is_ok, f"{ext} should be a valid audio format"
+        assert result.is_error
+        assert result.error_value.error_type == "validation_error"
+        mock_validate.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_process_voice_note(
-        self, voice_adapter, sample_voice_file, mock_adapter_context
+        self, voice_adapter, sample_voice_file, mock_adapter_context, mock_processor_cls
     ):
         """Test processing a voice note file."""
-        mock_processor_result = MagicMock(
+        mock_processor_result = SimpleProcessorResult(
             content={
                 "transcription": "Hello, this is a test voice note",
                 "segments": [{"text": "Hello"}],
@@ -100,49 +209,177 @@ class TestVoiceNoteAdapter:
             embeddings=None,
         )
 
-        with patch(
-            "src.etl.adapters.voice_note_adapter.VoiceNoteProcessor"
-        ) as MockProcessor:
-            mock_instance = MockProcessor.return_value
-            mock_instance.process = AsyncMock(return_value=mock_processor_result)
+        mock_processor_cls.return_value.process.return_value = mock_processor_result
 
-            result = await voice_adapter.process(
-                sample_voice_file, mock_adapter_context
-            )
+        result = await voice_adapter.process(sample_voice_file, mock_adapter_context)
 
-            assert result.is_ok, "Processing should succeed"
-            assert "transcription" in result.value.content
-            assert result.value.metadata["file_type"] == ".mp3"
+        assert result.is_ok, "Processing should succeed"
+        assert "transcription" in result.value.content
+        assert result.value.metadata["file_type"] == ".mp3"
 
     @pytest.mark.asyncio
     async def test_process_voice_note_processor_error(
-        self, voice_adapter, sample_voice_file, mock_adapter_context
+        self, voice_adapter, sample_voice_file, mock_adapter_context, mock_processor_cls
     ):
         """Test handling of processor errors."""
+        mock_processor_cls.return_value.process.side_effect = ValueError(
+            "Whisper API error"
+        )
+
+        result = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+
+        assert result.is_error, "Processing should fail and return error Result"
+        assert "Whisper API error" in str(result.error_value)
+
+    @pytest.mark.asyncio
+    async def test_transcription_cache_hit(
+        self, voice_adapter, sample_voice_file, mock_adapter_context, mock_processor_cls
+    ):
+        """Test that identical audio is only transcribed once."""
+        mock_processor_result = SimpleProcessorResult(
+            content={"transcription": "Cached voice note"},
+            metadata={"file_type": ".mp3", "confidence": 0.95},
+        )
+
+        mock_process = mock_processor_cls.return_value.process
+        mock_process.return_value = mock_processor_result
+
+        first = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+        second = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+
+        assert first.is_ok and second.is_ok
+        assert second.value == first.value
+        mock_process.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transcription_cache_hit_returns_private_copy(
+        self, voice_adapter, sample_voice_file, mock_adapter_context, mock_processor_cls
+    ):
+        """Test that mutating a returned result never corrupts the cache."""
+        mock_processor_cls.return_value.process.return_value = SimpleProcessorResult(
+            content={"transcription": "Cached voice note"},
+            metadata={"file_type": ".mp3", "confidence": 0.95},
+        )
+
+        first = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+        first.value.metadata["source"] = "first caller"
+        second = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+        second.value.content["transcription"] = "edited"
+        third = await voice_adapter.process(sample_voice_file, mock_adapter_context)
+
+        assert "source" not in third.value.metadata
+        assert third.value.content["transcription"] == "Cached voice note"
+
+    @pytest.mark.asyncio
+    async def test_transcription_cache_skips_failed_transcription(
+        self, voice_adapter, sample_voice_file, mock_adapter_context, mock_processor_cls
+    ):
+        """Test that zero-confidence (failed) transcriptions are not cached."""
+        mock_processor_result = SimpleProcessorResult(
+            content={"transcription": ""},
+            metadata={"file_type": ".mp3", "confidence": 0.0},
+        )
+
+        mock_process = mock_processor_cls.return_value.process
+        mock_process.return_value = mock_processor_result
+
+        await voice_adapter.process(sample_voice_file, mock_adapter_context)
+        await voice_adapter.process(sample_voice_file, mock_adapter_context)
+
+        assert mock_process.await_count == 2
+
+    @pytest.mark.parametrize("content", [b"", b"ID3" + b"\x00" * 4096])
+    def test_hash_file_uses_mmap(self, tmp_path, content):
+        """Test that cache keys hash a memory map and match a plain sha256."""
+        audio_file = tmp_path / "note.mp3"
+        audio_file.write_bytes(content)
+
         with patch(
-            "src.etl.adapters.voice_note_adapter.VoiceNoteProcessor"
-        ) as MockProcessor:
-            mock_instance = MockProcessor.return_value
-            mock_instance.process = AsyncMock(
-                side_effect=ValueError("Whisper API error")
-            )
+            "src.etl.adapters.voice_note_adapter.mmap.mmap", wraps=mmap.mmap
+        ) as mock_mmap:
+            digest = voice_note_adapter_module._hash_file(audio_file)
 
-            result = await voice_adapter.process(
-                sample_voice_file, mock_adapter_context
+        assert digest == hashlib.sha256(content).hexdigest()
+        assert mock_mmap.called == bool(content)
+
+    @pytest.mark.asyncio
+    async def test_process_batch_single_processor_call(
+        self, voice_adapter, tmp_path, mock_adapter_context, mock_processor_cls
+    ):
+        """Test that a batch is transcribed through one processor call."""
+        paths = [tmp_path / f"note{i}.mp3" for i in range(3)]
+        batch_results = [
+            SimpleProcessorResult(content={"transcription": f"note {i}"}, metadata={})
+            for i in range(3)
+        ]
+
+        mock_process_batch = mock_processor_cls.return_value.process_batch
+        mock_process_batch.return_value = batch_results
+
+        result = await voice_adapter.process_batch(paths, mock_adapter_context)
+
+        assert result.is_ok, "Batch processing should succeed"
+        assert result.value == batch_results
+        mock_processor_cls.assert_called_once()
+        mock_process_batch.assert_awaited_once_with(paths)
+
+    @pytest.mark.asyncio
+    async def test_process_batch_uses_transcription_cache(
+        self, voice_adapter, tmp_path, mock_adapter_context, mock_processor_cls
+    ):
+        """Test that batches share the cache with single-file processing."""
+        paths = [tmp_path / f"note{i}.mp3" for i in range(3)]
+        for i, path in enumerate(paths):
+            path.write_bytes(b"ID3" + bytes([i]))
+        cached_result = SimpleProcessorResult(
+            content={"transcription": "note 1"},
+            metadata={"file_type": ".mp3", "confidence": 0.95},
+        )
+        mock_processor_cls.return_value.process.return_value = cached_result
+        await voice_adapter.process(paths[1], mock_adapter_context)
+
+        fresh = [
+            SimpleProcessorResult(
+                content={"transcription": f"note {i}"},
+                metadata={"file_type": ".mp3", "confidence": 0.95},
             )
+            for i in (0, 2)
+        ]
+        mock_process_batch = mock_processor_cls.return_value.process_batch
+        mock_process_batch.return_value = fresh
 
-            assert result.is_error, "Processing should fail and return error Result"
-            assert "Whisper API error" in str(result.error_value)
+        first = await voice_adapter.process_batch(paths, mock_adapter_context)
+        second = await voice_adapter.process_batch(paths, mock_adapter_context)
+
+        mock_process_batch.assert_awaited_once_with([paths[0], paths[2]])
+        assert first.value == [fresh[0], cached_result, fresh[1]]
+        assert second.value == first.value
+
+    @pytest.mark.asyncio
+    async def test_process_batch_processor_error(
+        self, voice_adapter, tmp_path, mock_adapter_context, mock_processor_cls
+    ):
+        """Test handling of batch processor errors."""
+        mock_processor_cls.return_value.process_batch.side_effect = RuntimeError(
+            "Whisper API error"
+        )
+
+        result = await voice_adapter.process_batch(
+            [tmp_path / "note.mp3"], mock_adapter_context
+        )
+
+        assert result.is_error, "Batch processing should return error Result"
+        assert "Whisper API error" in str(result.error_value)
 
     @pytest.mark.asyncio
     async def test_persist_voice_data(self, voice_adapter, mock_adapter_context):
         """Test persisting processed voice note data."""
-        processor_result = MagicMock(
+        processor_result = SimpleProcessorResult(
             content={"transcription": "Hello world", "segments": []},
-            metadata={"file_type": ".mp3"},
+            metadata=_MP3_META,
         )
 
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = _mk_fake_session()
         result = await voice_adapter.persist(
             processor_result, mock_adapter_context, mock_session
         )
@@ -151,6 +388,36 @@ class TestVoiceNoteAdapter:
         mock_session.add.assert_called_once()
         mock_session.flush.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_persist_batch_single_flush(
+        self, voice_adapter, mock_adapter_context
+    ):
+        """Test that a batch of voice notes is persisted with one flush."""
+        processor_results = [
+            SimpleProcessorResult(
+                content={"transcription": f"Note {i}", "language": "en"},
+                metadata={"file_type": ".mp3", "confidence": 0.95},
+            )
+            for i in range(3)
+        ]
+
+        mock_session = _mk_fake_session()
+        result = await voice_adapter.persist_batch(
+            processor_results, mock_adapter_context, mock_session
+        )
+
+        assert result.is_ok, "Batch persistence should succeed"
+        assert [note.transcription for note in result.value] == [
+            "Note 0",
+            "Note 1",
+            "Note 2",
+        ]
+        assert all(
+            note.user_id == mock_adapter_context.user_id for note in result.value
+        )
+        assert mock_session.add.call_count == 3
+        mock_session.flush.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_cleanup(
         self, voice_adapter, sample_voice_file, mock_adapter_context
@@ -167,35 +434,27 @@ class TestVoiceNoteAdapter:
         self, voice_adapter, sample_voice_file, mock_adapter_context
     ):
         """Test the complete 4-phase pipeline."""
-        mock_processor_result = MagicMock(
+        mock_processor_result = SimpleProcessorResult(
             content={"transcription": "Test transcription"},
-            metadata={"file_type": ".mp3"},
+            metadata=_MP3_META,
         )
         mock_voice_note = MagicMock()
 
-        with patch.object(
-            voice_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.ok(None)
-            with patch.object(
-                voice_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_process.return_value = Result.ok(mock_processor_result)
-                with patch.object(
-                    voice_adapter, "persist", new_callable=AsyncMock
-                ) as mock_persist:
-                    mock_persist.return_value = Result.ok(mock_voice_note)
-                    with patch.object(
-                        voice_adapter, "cleanup", new_callable=AsyncMock
-                    ) as mock_cleanup:
-                        mock_session = AsyncMock(spec=AsyncSession)
-                        result = await voice_adapter.execute(
-                            sample_voice_file, mock_adapter_context, mock_session
-                        )
-
-                        assert result.is_ok, "Execute should succeed"
-                        mock_persist.assert_called_once()
-                        mock_cleanup.assert_called_once()
+        with patch.multiple(
+            voice_adapter,
+            validate_input=AsyncMock(return_value=Result.ok(None)),
+            process=AsyncMock(return_value=Result.ok(mock_processor_result)),
+            persist=AsyncMock(return_value=Result.ok(mock_voice_note)),
+            cleanup=AsyncMock(),
+        ):
+            mock_session = _mk_fake_session()
+            result = await voice_adapter.execute(
+                sample_voice_file, mock_adapter_context, mock_session
+            )
+
+            assert result.is_ok, "Execute should succeed"
+            voice_adapter.persist.assert_called_once()
+            voice_adapter.cleanup.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_validation_failure(
@@ -206,25 +465,23 @@ class TestVoiceNoteAdapter:
             "Validation failed", error_type="validation_error"
         )
 
-        with patch.object(
-            voice_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.error(validation_error)
-            with patch.object(
-                voice_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_session = AsyncMock(spec=AsyncSession)
-                result = await voice_adapter.execute(
-                    sample_voice_file, mock_adapter_context, mock_session
-                )
-
-                assert result.is_error, "Execute should fail at validation"
-                mock_process.assert_not_called()
+        with patch.multiple(
+            voice_adapter,
+            validate_input=AsyncMock(return_value=Result.error(validation_error)),
+            process=AsyncMock(),
+        ):
+            mock_session = _mk_fake_session()
+            result = await voice_adapter.execute(
+                sample_voice_file, mock_adapter_context, mock_session
+            )
+
+            assert result.is_error, "Execute should fail at validation"
+            voice_adapter.process.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_transcription_quality(self, voice_adapter, mock_adapter_context):
         """Test that transcription is properly extracted."""
-        processor_result = MagicMock(
+        processor_result = SimpleProcessorResult(
             content={
                 "transcription": "Hello world, this is a test",
                 "confidence": 0.95,
@@ -233,44 +490,38 @@ class TestVoiceNoteAdapter:
                     {"text": "world", "start": 1.5, "end": 2},
                 ],
             },
-            metadata={"file_type": ".mp3"},
+            metadata=_MP3_META,
         )
 
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = _mk_fake_session()
         result = await voice_adapter.persist(
             processor_result, mock_adapter_context, mock_session
         )
 
         assert result.is_ok, "Persistence should succeed"
+        assert result.value.transcription == "Hello world, this is a test"
         mock_session.add.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_large_voice_file(self, voice_adapter, tmp_path):
+    async def test_large_voice_file(
+        self, voice_adapter, base_context, large_voice_file
+    ):
         """Test processing of large voice file."""
-        large_file = tmp_path / "large_note.mp3"
-        # Create a 100MB file
-        large_content = b"ID3" + (b"x" * (100 * 1024 * 1024 - 3))
-        large_file.write_bytes(large_content)
-
-        context = AdapterContext(user_id=1, source_id=1, data_type=DataType.VOICE_NOTE)
-        result = await voice_adapter.validate_input(large_file, context)
+        result = await voice_adapter.validate_input(large_voice_file, base_context)
 
-        # Should still validate, but may need size limits
-        # Check that result is a Result type
-        assert result.is_ok or result.is_error, "Result should be a Result type"
+        # 100MB is over the 50MB audio limit
+        assert result.is_error, "Oversized voice file should fail validation"
+        assert result.error_value.error_type == "validation_error"
 
     @pytest.mark.asyncio
     async def test_silent_voice_note(self, voice_adapter, mock_adapter_context):
         """Test processing of silent voice note."""
-        processor_result = MagicMock(
-            content={
-                "transcription": "",  # Empty transcription for silent audio
-                "segments": [],
-            },
-            metadata={"file_type": ".mp3"},
+        processor_result = SimpleProcessorResult(
+            content=_SILENT_CONTENT,
+            metadata=_MP3_META,
         )
 
-        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session = _mk_fake_session()
         result = await voice_adapter.persist(
             processor_result, mock_adapter_context, mock_session
         )
@@ -283,50 +534,44 @@ class TestVoiceNoteAdapter:
         self, voice_adapter, sample_voice_file, mock_adapter_context
     ):
         """Test that context is passed correctly through all phases."""
-        mock_processor_result = MagicMock(content={}, metadata={})
+        mock_processor_result = SimpleProcessorResult(content=_EMPTY, metadata=_EMPTY)
         mock_voice_note = MagicMock()
 
-        with patch.object(
-            voice_adapter, "validate_input", new_callable=AsyncMock
-        ) as mock_validate:
-            mock_validate.return_value = Result.ok(None)
-            with patch.object(
-                voice_adapter, "process", new_callable=AsyncMock
-            ) as mock_process:
-                mock_process.return_value = Result.ok(mock_processor_result)
-                with patch.object(
-                    voice_adapter, "persist", new_callable=AsyncMock
-                ) as mock_persist:
-                    mock_persist.return_value = Result.ok(mock_voice_note)
-                    with patch.object(voice_adapter, "cleanup", new_callable=AsyncMock):
-                        mock_session = AsyncMock(spec=AsyncSession)
-                        await voice_adapter.execute(
-                            sample_voice_file, mock_adapter_context, mock_session
-                        )
-
-                        # Verify process received input_data and context
-                        mock_process.assert_called_once_with(
-                            sample_voice_file, mock_adapter_context
-                        )
+        with patch.multiple(
+            voice_adapter,
+            validate_input=AsyncMock(return_value=Result.ok(None)),
+            process=AsyncMock(return_value=Result.ok(mock_processor_result)),
+            persist=AsyncMock(return_value=Result.ok(mock_voice_note)),
+            cleanup=AsyncMock(),
+        ):
+            mock_session = _mk_fake_session()
+            await voice_adapter.execute(
+                sample_voice_file, mock_adapter_context, mock_session
+            )
+
+            # Verify process received input_data and context
+            voice_adapter.process.assert_called_once_with(
+                sample_voice_file, mock_adapter_context
+            )
 
     @pytest.mark.asyncio
-    async def test_multiple_format_support(self, voice_adapter, tmp_path):
-        """Test handling of various audio formats."""
-        formats_and_magic = [
+    @pytest.mark.parametrize(
+        "ext,magic_bytes",
+        [
             (".mp3", b"ID3"),
             (".wav", b"RIFF"),
             (".ogg", b"OggS"),
             (".webm", b"\x1a\x45\xdf\xa3"),
             (".m4a", b"\x00\x00\x00\x20ftypisom"),
-        ]
-
-        for ext, magic_bytes in formats_and_magic:
-            test_file = tmp_path / f"note{ext}"
-            test_file.write_bytes(magic_bytes)
+        ],
+    )
+    async def test_multiple_format_support(
+        self, voice_adapter, base_context, tmp_path, ext, magic_bytes
+    ):
+        """Test handling of various audio formats."""
+        test_file = tmp_path / f"note{ext}"
+        test_file.write_bytes(magic_bytes)
 
-            context = AdapterContext(
-                user_id=1, source_id=1, data_type=DataType.VOICE_NOTE
-            )
-            result = await voice_adapter.validate_input(test_file, context)
+        result = await voice_adapter.validate_input(test_file, base_context)
 
-            assert result.is_ok, f"Should support {ext} format"
+        assert result.is_ok, f"Should support {ext} format"
@@ -8,16 +8,23 @@ Tests consolidation logic with mocked LLM APIs to ensure:
 - DI pattern enables strategy swapping
 """
 
+import asyncio
 import json
+from contextlib import ExitStack
+from typing import NamedTuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy import CompoundSelect
+from sqlalchemy.dialects import postgresql
 
+from src.consolidation import llm_adapter
 from src.consolidation.data_aggregator import DataAggregator
 from src.consolidation.llm_adapter import (
     LLMProviderFactory,
     parse_json_response,
 )
+from src.consolidation.llm_cache import LLMCache
 from src.consolidation.orchestrator import ProfileConsolidationOrchestrator
 from src.consolidation.strategy import DefaultConsolidationStrategy
 from src.etl.core.result import Result
@@ -155,6 +162,52 @@ def sample_consolidated_profile():
     }
 
 
+@pytest.fixture
+def mock_llm_provider(sample_consolidated_profile):
+    """Mock LLM provider returning the sample consolidated profile."""
+    provider = MagicMock()
+    provider.call = AsyncMock(return_value=json.dumps(sample_consolidated_profile))
+    provider.get_provider_name = MagicMock(return_value="anthropic")
+    return provider
+
+
+class _OrchestratorMocks(NamedTuple):
+    """Patched orchestrator pipeline steps."""
+
+    factory: MagicMock
+    aggregate: AsyncMock
+    consolidate: AsyncMock
+    persist: AsyncMock
+
+
+@pytest.fixture
+def orchestrator_mocks(mock_llm_provider):
+    """Patch provider creation, aggregation, consolidation and persistence."""
+    with ExitStack() as stack:
+        factory = stack.enter_context(
+            patch(
+                "src.consolidation.llm_adapter.LLMProviderFactory.create",
+                return_value=mock_llm_provider,
+            )
+        )
+        aggregate = stack.enter_context(
+            patch.object(DataAggregator, "aggregate_user_data", new_callable=AsyncMock)
+        )
+        consolidate = stack.enter_context(
+            patch.object(
+                DefaultConsolidationStrategy, "consolidate", new_callable=AsyncMock
+            )
+        )
+        persist = stack.enter_context(
+            patch.object(
+                ProfileConsolidationOrchestrator,
+                "_persist_profile",
+                new_callable=AsyncMock,
+            )
+        )
+        yield _OrchestratorMocks(factory, aggregate, consolidate, persist)
+
+
 # ============================================================================
 # DATA AGGREGATOR TESTS
 # ============================================================================
@@ -167,13 +220,11 @@ async def test_data_aggregator_with_complete_data(db_session):
     user_id = "1"
 
     # Mock database queries
-    with (
-        patch.object(aggregator, "_get_resume_data", new_callable=AsyncMock) as mock_resume,
-        patch.object(aggregator, "_get_photo_data", new_callable=AsyncMock) as mock_photos,
+    with patch.multiple(
+        aggregator,
+        _get_resume_data=AsyncMock(return_value={"full_text": "test resume"}),
+        _get_photo_data=AsyncMock(return_value=[{"caption": "test photo"}]),
     ):
-        mock_resume.return_value = {"full_text": "test resume"}
-        mock_photos.return_value = [{"caption": "test photo"}]
-
         result = await aggregator.aggregate_user_data(user_id)
 
         assert result.is_ok
@@ -188,15 +239,12 @@ async def test_data_aggregator_with_partial_data(db_session):
     aggregator = DataAggregator(db_session)
     user_id = "2"
 
-    with (
-        patch.object(aggregator, "_get_resume_data", new_callable=AsyncMock) as mock_resume,
-        patch.object(aggregator, "_get_photo_data", new_callable=AsyncMock) as mock_photos,
-        patch.object(aggregator, "_get_voice_note_data", new_callable=AsyncMock) as mock_voice,
+    with patch.multiple(
+        aggregator,
+        _get_resume_data=AsyncMock(return_value=None),
+        _get_photo_data=AsyncMock(return_value=[]),
+        _get_voice_note_data=AsyncMock(return_value=[{"transcription": "test"}]),
     ):
-        mock_resume.return_value = None
-        mock_photos.return_value = []
-        mock_voice.return_value = [{"transcription": "test"}]
-
         result = await aggregator.aggregate_user_data(user_id)
 
         assert result.is_ok
@@ -222,21 +270,118 @@ async def test_data_aggregator_error_handling(db_session):
         assert isinstance(result.error_value, Exception)
 
 
+def _mk_query_session(tracker: dict) -> MagicMock:
+    """Build a session whose execute records how many queries overlap."""
+
+    async def execute(_stmt):
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        await asyncio.sleep(0)
+        tracker["active"] -= 1
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        result.scalars.return_value.first.return_value = None
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_data_aggregator_shared_session_runs_sequentially():
+    """Test that queries on a single shared session never overlap."""
+    tracker = {"active": 0, "peak": 0}
+    session = _mk_query_session(tracker)
+    aggregator = DataAggregator(session)
+
+    result = await aggregator.aggregate_user_data(1)
+
+    assert result.is_ok
+    assert list(result.value) == [key for key, _ in DataAggregator._FETCHERS]
+    assert session.execute.await_count == len(DataAggregator._FETCHERS)
+    assert tracker["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_data_aggregator_postgres_single_round_trip():
+    """Test that PostgreSQL sessions fetch every source in one UNION ALL query."""
+    result = MagicMock()
+    result.all.return_value = [
+        ("resume", {"full_text": "Engineer", "structured_data": {}}),
+        ("photos", {"file_reference": "a.jpg"}),
+        ("photos", {"file_reference": "b.jpg"}),
+    ]
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute = AsyncMock(return_value=result)
+    aggregator = DataAggregator(session)
+
+    aggregated = await aggregator.aggregate_user_data(1)
+
+    assert aggregated.is_ok
+    session.execute.assert_awaited_once()
+    assert list(aggregated.value) == [key for key, _ in DataAggregator._FETCHERS]
+    assert aggregated.value["resume"] == {"full_text": "Engineer", "structured_data": {}}
+    assert aggregated.value["photos"] == [
+        {"file_reference": "a.jpg"},
+        {"file_reference": "b.jpg"},
+    ]
+    assert aggregated.value["voice_notes"] == []
+
+    statement = session.execute.await_args.args[0]
+    assert statement.compile().string.count("UNION ALL") == len(DataAggregator._FETCHERS) - 1
+
+
+def test_data_aggregator_batch_query_compiles_for_postgresql():
+    """Test that the UNION ALL query compiles with the PostgreSQL dialect."""
+    aggregator = DataAggregator(MagicMock())
+
+    sql = str(aggregator._build_batch_query(1).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("UNION ALL") == len(DataAggregator._SOURCES) - 1
+    assert sql.count("json_build_object(") == len(DataAggregator._SOURCES)
+    assert "'resume' AS kind" in sql
+    assert "json_build_object('full_text', resume_data.full_text" in sql
+
+
+@pytest.mark.asyncio
+async def test_data_aggregator_postgres_batch_failure_falls_back():
+    """Test that a failed UNION ALL query falls back to per-source queries."""
+    tracker = {"active": 0, "peak": 0}
+    session = _mk_query_session(tracker)
+    session.get_bind.return_value.dialect.name = "postgresql"
+    per_source_execute = session.execute.side_effect
+
+    async def execute(stmt):
+        if isinstance(stmt, CompoundSelect):
+            raise RuntimeError("json_build_object failed")
+        return await per_source_execute(stmt)
+
+    session.execute.side_effect = execute
+    aggregator = DataAggregator(session)
+
+    result = await aggregator.aggregate_user_data(1)
+
+    assert result.is_ok
+    assert result.value["resume"] is None
+    assert result.value["photos"] == []
+    assert session.execute.await_count == 1 + len(DataAggregator._FETCHERS)
+    session.begin_nested.assert_called_once()
+
+
 # ============================================================================
 # STRATEGY AND LLM PROVIDER TESTS
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_consolidation_strategy_with_valid_data(sample_raw_data, sample_consolidated_profile):
+async def test_consolidation_strategy_with_valid_data(sample_raw_data, mock_llm_provider):
     """Test consolidation strategy with mocked LLM provider."""
     user_id = "3"
 
-    # Create mock LLM provider
-    mock_llm_provider = MagicMock()
-    mock_llm_provider.call = AsyncMock(return_value=json.dumps(sample_consolidated_profile))
-    mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
-
     # Create strategy with injected provider
     strategy = DefaultConsolidationStrategy(user_id)
 
@@ -251,11 +396,10 @@ async def test_consolidation_strategy_with_valid_data(sample_raw_data, sample_co
 
 
 @pytest.mark.asyncio
-async def test_consolidation_strategy_with_empty_data():
+async def test_consolidation_strategy_with_empty_data(mock_llm_provider):
     """Test consolidation strategy rejects empty data."""
     user_id = "550e8400-e29b-41d4-a716-446655441155"
 
-    mock_llm_provider = MagicMock()
     strategy = DefaultConsolidationStrategy(user_id)
 
     empty_data = {
@@ -290,19 +434,28 @@ async def test_llm_json_response_parsing():
     result = parse_json_response(text_with_json)
     assert result["personality_core"]["openness"] == "High"
 
+    # Test deeply nested JSON inside a markdown fence
+    fenced = '```json\n{"a": {"b": {"c": [1, {"d": "}"}]}}}\n```'
+    result = parse_json_response(fenced)
+    assert result["a"]["b"]["c"][1]["d"] == "}"
+
+    # Test escaped quotes and braces inside strings don't end the object early
+    result = parse_json_response('Profile: {"bio": "says \\"hi}\\" often"} thanks')
+    assert result["bio"] == 'says "hi}" often'
+
     # Test invalid JSON raises error
     with pytest.raises(ValueError):
         parse_json_response("This is not JSON at all")
+    with pytest.raises(ValueError, match="Could not parse"):
+        parse_json_response("Profile: {broken json")
 
 
 @pytest.mark.asyncio
-async def test_consolidation_strategy_invalid_response(sample_raw_data):
+async def test_consolidation_strategy_invalid_response(sample_raw_data, mock_llm_provider):
     """Test consolidation strategy handles invalid LLM response."""
     user_id = "550e8400-e29b-41d4-a716-446655441156"
 
-    mock_llm_provider = MagicMock()
-    mock_llm_provider.call = AsyncMock(return_value="Invalid response, not JSON")
-    mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
+    mock_llm_provider.call.return_value = "Invalid response, not JSON"
 
     strategy = DefaultConsolidationStrategy(user_id)
     result = await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
@@ -310,42 +463,76 @@ async def test_consolidation_strategy_invalid_response(sample_raw_data):
     assert result.is_error
 
 
+@pytest.mark.asyncio
+async def test_consolidation_cache_hit_skips_llm(
+    tmp_path, sample_raw_data, mock_llm_provider
+):
+    """Test identical prompts are served from the LLM response cache."""
+    user_id = "3"
+
+    strategy = DefaultConsolidationStrategy(user_id, cache=LLMCache(tmp_path / "llm.db"))
+
+    first = await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
+    second = await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
+
+    assert first.is_ok and second.is_ok
+    assert second.value.personality_core == first.value.personality_core
+    mock_llm_provider.call.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_consolidation_cache_skips_invalid_response(
+    tmp_path, sample_raw_data, mock_llm_provider
+):
+    """Test responses that fail validation are not cached."""
+    user_id = "3"
+
+    mock_llm_provider.call.return_value = "Invalid response, not JSON"
+
+    strategy = DefaultConsolidationStrategy(user_id, cache=LLMCache(tmp_path / "llm.db"))
+
+    await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
+    await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
+
+    assert mock_llm_provider.call.await_count == 2
+
+
 # ============================================================================
 # LLM PROVIDER FACTORY TESTS
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_consolidation_with_different_llm_providers(
-    sample_raw_data, sample_consolidated_profile
-):
+async def test_consolidation_with_different_llm_providers(sample_raw_data, mock_llm_provider):
     """Test consolidation strategy works with different LLM providers."""
     user_id = "550e8400-e29b-41d4-a716-446655441157"
 
     # Test with Anthropic provider mock
-    anthropic_provider = MagicMock()
-    anthropic_provider.call = AsyncMock(return_value=json.dumps(sample_consolidated_profile))
-    anthropic_provider.get_provider_name = MagicMock(return_value="anthropic")
-
     strategy = DefaultConsolidationStrategy(user_id)
-    result = await strategy.consolidate(user_id, sample_raw_data, anthropic_provider)
+    result = await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
 
     assert result.is_ok
     assert result.value.user_id == user_id
 
     # Test with OpenAI provider mock
-    openai_provider = MagicMock()
-    openai_provider.call = AsyncMock(return_value=json.dumps(sample_consolidated_profile))
-    openai_provider.get_provider_name = MagicMock(return_value="openai")
+    mock_llm_provider.get_provider_name.return_value = "openai"
 
-    result = await strategy.consolidate(user_id, sample_raw_data, openai_provider)
+    result = await strategy.consolidate(user_id, sample_raw_data, mock_llm_provider)
 
     assert result.is_ok
     assert result.value.user_id == user_id
 
 
+@pytest.fixture
+def clear_provider_cache():
+    """Drop cached LLM providers so each test builds its own."""
+    llm_adapter._providers.clear()
+    yield
+    llm_adapter._providers.clear()
+
+
 @pytest.mark.asyncio
-async def test_llm_provider_factory_creates_providers():
+async def test_llm_provider_factory_creates_providers(clear_provider_cache):
     """Test LLM provider factory creates correct provider instances."""
     # Mock the provider initialization to avoid API key validation
     with patch("src.consolidation.llm_adapter.get_settings") as mock_settings:
@@ -366,13 +553,53 @@ async def test_llm_provider_factory_creates_providers():
         LLMProviderFactory.create("invalid_provider")
 
 
+def test_llm_provider_factory_reuses_providers(clear_provider_cache):
+    """Test repeated factory calls share one provider per name."""
+    with patch("src.consolidation.llm_adapter.get_settings") as mock_settings:
+        mock_settings.return_value.anthropic_api_key = "test-key"
+        mock_settings.return_value.openai_api_key = "test-key"
+
+        anthropic_provider = LLMProviderFactory.create("anthropic")
+        assert LLMProviderFactory.create("Anthropic") is anthropic_provider
+        assert LLMProviderFactory.create("openai") is not anthropic_provider
+
+
+def test_llm_provider_factory_rebuilds_providers_per_event_loop(
+    clear_provider_cache,
+):
+    """Test each event loop gets its own provider and semaphore."""
+    with patch("src.consolidation.llm_adapter.get_settings") as mock_settings:
+        mock_settings.return_value.anthropic_api_key = "test-key"
+
+        async def create_and_contend():
+            provider = LLMProviderFactory.create("anthropic")
+            semaphore = provider._semaphore
+            limit = semaphore._value
+            for _ in range(limit):
+                await semaphore.acquire()
+            # A blocked acquire binds the semaphore to the running loop
+            waiter = asyncio.ensure_future(semaphore.acquire())
+            await asyncio.sleep(0)
+            for _ in range(limit + 1):
+                semaphore.release()
+            await waiter
+            return provider
+
+        first = asyncio.run(create_and_contend())
+        second = asyncio.run(create_and_contend())
+
+    assert second is not first
+
+
 # ============================================================================
 # ORCHESTRATOR TESTS
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_with_injected_strategy(db_session, sample_raw_data):
+async def test_orchestrator_with_injected_strategy(
+    db_session, sample_raw_data, mock_llm_provider, orchestrator_mocks
+):
     """Test orchestrator accepts injected strategy via DI."""
     user_id = "4"
 
@@ -380,76 +607,48 @@ async def test_orchestrator_with_injected_strategy(db_session, sample_raw_data):
     mock_strategy = AsyncMock()
     mock_strategy.consolidate = AsyncMock(return_value=Result.ok(MagicMock(spec=object)))
 
-    # Create mock LLM provider to avoid API key validation
-    mock_llm_provider = MagicMock()
-    mock_llm_provider.call = AsyncMock(return_value="{}")
-    mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
-
-    with (
-        patch.object(
-            DataAggregator, "aggregate_user_data", new_callable=AsyncMock
-        ) as mock_aggregate,
-        patch.object(
-            ProfileConsolidationOrchestrator, "_persist_profile", new_callable=AsyncMock
-        ) as mock_persist,
-    ):
-        mock_aggregate.return_value = Result.ok(sample_raw_data)
-        mock_persist.return_value = Result.ok(MagicMock())
+    orchestrator_mocks.aggregate.return_value = Result.ok(sample_raw_data)
+    orchestrator_mocks.persist.return_value = Result.ok(MagicMock())
 
-        orchestrator = ProfileConsolidationOrchestrator.create_with_strategy(
-            db_session, mock_strategy, llm_provider=mock_llm_provider
-        )
+    orchestrator = ProfileConsolidationOrchestrator.create_with_strategy(
+        db_session, mock_strategy, llm_provider=mock_llm_provider
+    )
 
-        result = await orchestrator.consolidate_user_profile(user_id)
+    result = await orchestrator.consolidate_user_profile(user_id)
 
-        assert result.is_ok
-        mock_strategy.consolidate.assert_called_once()
+    assert result.is_ok
+    mock_strategy.consolidate.assert_called_once()
+    orchestrator_mocks.consolidate.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_with_llm_provider_selection(db_session, sample_raw_data):
+async def test_orchestrator_with_llm_provider_selection(
+    db_session, sample_raw_data, mock_llm_provider, orchestrator_mocks
+):
     """Test orchestrator supports LLM provider-based strategy selection."""
     user_id = "5"
 
-    # Mock LLM provider factory to avoid API key validation
-    with patch("src.consolidation.llm_adapter.LLMProviderFactory.create") as mock_factory:
-        mock_llm_provider = MagicMock()
-        mock_llm_provider.call = AsyncMock(return_value="{}")
-        mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
-        mock_factory.return_value = mock_llm_provider
+    orchestrator_mocks.aggregate.return_value = Result.ok(sample_raw_data)
+    mock_profile = MagicMock()
+    mock_profile.user_id = user_id
+    orchestrator_mocks.consolidate.return_value = Result.ok(mock_profile)
+    orchestrator_mocks.persist.return_value = Result.ok(mock_profile)
 
-        with (
-            patch.object(
-                DataAggregator, "aggregate_user_data", new_callable=AsyncMock
-            ) as mock_aggregate,
-            patch.object(
-                DefaultConsolidationStrategy, "consolidate", new_callable=AsyncMock
-            ) as mock_consolidate,
-            patch.object(
-                ProfileConsolidationOrchestrator, "_persist_profile", new_callable=AsyncMock
-            ) as mock_persist,
-        ):
-            mock_aggregate.return_value = Result.ok(sample_raw_data)
-            mock_profile = MagicMock()
-            mock_profile.user_id = user_id
-            mock_consolidate.return_value = Result.ok(mock_profile)
-            mock_persist.return_value = Result.ok(mock_profile)
-
-            # Test with Anthropic provider
-            orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
-                db_session, llm_provider_name="anthropic"
-            )
-            result = await orchestrator.consolidate_user_profile(user_id)
+    # Test with Anthropic provider
+    orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
+        db_session, llm_provider_name="anthropic"
+    )
+    result = await orchestrator.consolidate_user_profile(user_id)
 
-            assert result.is_ok
+    assert result.is_ok
 
-            # Test with OpenAI provider
-            mock_llm_provider.get_provider_name = MagicMock(return_value="openai")
-            orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
-                db_session, llm_provider_name="openai"
-            )
-            result = await orchestrator.consolidate_user_profile(user_id)
-            assert result.is_ok
+    # Test with OpenAI provider
+    mock_llm_provider.get_provider_name.return_value = "openai"
+    orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
+        db_session, llm_provider_name="openai"
+    )
+    result = await orchestrator.consolidate_user_profile(user_id)
+    assert result.is_ok
 
 
 @pytest.mark.asyncio
@@ -495,38 +694,19 @@ async def test_orchestrator_consolidation_error(db_session, sample_raw_data):
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_persistence_error(db_session, sample_raw_data):
+async def test_orchestrator_persistence_error(db_session, sample_raw_data, orchestrator_mocks):
     """Test orchestrator handles persistence errors."""
     user_id = "6"
 
-    # Mock LLM provider factory to avoid API key validation
-    with patch("src.consolidation.llm_adapter.LLMProviderFactory.create") as mock_factory:
-        mock_llm_provider = MagicMock()
-        mock_llm_provider.call = AsyncMock(return_value="{}")
-        mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
-        mock_factory.return_value = mock_llm_provider
+    orchestrator_mocks.aggregate.return_value = Result.ok(sample_raw_data)
+    orchestrator_mocks.consolidate.return_value = Result.ok(MagicMock())
+    orchestrator_mocks.persist.return_value = Result.error(Exception("Database error"))
 
-        with (
-            patch.object(
-                DataAggregator, "aggregate_user_data", new_callable=AsyncMock
-            ) as mock_aggregate,
-            patch.object(
-                DefaultConsolidationStrategy, "consolidate", new_callable=AsyncMock
-            ) as mock_consolidate,
-            patch.object(
-                ProfileConsolidationOrchestrator, "_persist_profile", new_callable=AsyncMock
-            ) as mock_persist,
-        ):
-            mock_aggregate.return_value = Result.ok(sample_raw_data)
-            mock_profile = MagicMock()
-            mock_consolidate.return_value = Result.ok(mock_profile)
-            mock_persist.return_value = Result.error(Exception("Database error"))
+    orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(db_session)
+    result = await orchestrator.consolidate_user_profile(user_id)
 
-            orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(db_session)
-            result = await orchestrator.consolidate_user_profile(user_id)
-
-            assert result.is_error
-            assert "Database error" in str(result.error_value)
+    assert result.is_error
+    assert "Database error" in str(result.error_value)
 
 
 # ============================================================================
@@ -535,44 +715,26 @@ async def test_orchestrator_persistence_error(db_session, sample_raw_data):
 
 
 @pytest.mark.asyncio
-async def test_consolidation_pipeline_happy_path(db_session, sample_raw_data):
+async def test_consolidation_pipeline_happy_path(db_session, sample_raw_data, orchestrator_mocks):
     """Test complete consolidation pipeline with mocked LLM."""
     user_id = "7"
 
-    # Mock LLM provider factory to avoid API key validation
-    with patch("src.consolidation.llm_adapter.LLMProviderFactory.create") as mock_factory:
-        mock_llm_provider = MagicMock()
-        mock_llm_provider.call = AsyncMock(return_value="{}")
-        mock_llm_provider.get_provider_name = MagicMock(return_value="anthropic")
-        mock_factory.return_value = mock_llm_provider
+    # Setup mocks
+    orchestrator_mocks.aggregate.return_value = Result.ok(sample_raw_data)
 
-        with (
-            patch.object(
-                DataAggregator, "aggregate_user_data", new_callable=AsyncMock
-            ) as mock_aggregate,
-            patch.object(
-                DefaultConsolidationStrategy, "consolidate", new_callable=AsyncMock
-            ) as mock_consolidate,
-            patch.object(
-                ProfileConsolidationOrchestrator, "_persist_profile", new_callable=AsyncMock
-            ) as mock_persist,
-        ):
-            # Setup mocks
-            mock_aggregate.return_value = Result.ok(sample_raw_data)
-
-            mock_profile = MagicMock()
-            mock_profile.user_id = user_id
-            mock_consolidate.return_value = Result.ok(mock_profile)
-            mock_persist.return_value = Result.ok(mock_profile)
-
-            # Execute pipeline
-            orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
-                db_session, llm_provider_name="anthropic"
-            )
-            result = await orchestrator.consolidate_user_profile(user_id)
+    mock_profile = MagicMock()
+    mock_profile.user_id = user_id
+    orchestrator_mocks.consolidate.return_value = Result.ok(mock_profile)
+    orchestrator_mocks.persist.return_value = Result.ok(mock_profile)
 
-            # Verify success
-            assert result.is_ok
-            mock_aggregate.assert_called_once()
-            mock_consolidate.assert_called_once()
-            mock_persist.assert_called_once()
+    # Execute pipeline
+    orchestrator = ProfileConsolidationOrchestrator.create_with_llm_provider(
+        db_session, llm_provider_name="anthropic"
+    )
+    result = await orchestrator.consolidate_user_profile(user_id)
+
+    # Verify success
+    assert result.is_ok
+    orchestrator_mocks.aggregate.assert_called_once()
+    orchestrator_mocks.consolidate.assert_called_once()
+    orchestrator_mocks.persist.assert_called_once()
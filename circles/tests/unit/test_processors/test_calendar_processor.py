@@ -2,8 +2,19 @@
 Unit tests for CalendarProcessor.
 
 Tests ICS/iCal calendar file processing and event extraction.
+
+Safe under pytest-xdist (``pytest -n auto --dist loadscope``): the
+session-scoped sample/empty ICS files come from tmp_path_factory, which
+gives each worker its own base directory, the remaining files go under
+per-test tmp_path, and the session-scoped processor is built once per
+worker process, so workers never share a file or a semaphore.
 """
 
+import asyncio
+import os
+import time
+from datetime import date, datetime
+
 import pytest
 from src.etl.processors.calendar_processor import (
     CalendarProcessor,
@@ -12,20 +23,7 @@ from src.etl.processors.calendar_processor import (
 
 from tests.fixtures.fixture_factories import DataTypeFixtures
 
-
-@pytest.mark.unit
-class TestCalendarProcessor:
-    """Test CalendarProcessor functionality."""
-
-    @pytest.fixture
-    async def calendar_processor(self):
-        """Create a CalendarProcessor instance."""
-        return CalendarProcessor()
-
-    @pytest.fixture
-    def sample_ics_file(self, tmp_path):
-        """Create a sample ICS calendar file."""
-        ics_content = """BEGIN:VCALENDAR
+SAMPLE_ICS = """BEGIN:VCALENDAR
 VERSION:2.0
 PRODID:-//Test//Test//EN
 BEGIN:VEVENT
@@ -49,21 +47,70 @@ DTEND:20240116T110000Z
 END:VEVENT
 END:VCALENDAR
 """
-        ics_path = tmp_path / "calendar.ics"
-        ics_path.write_text(ics_content)
-        return ics_path
 
-    @pytest.fixture
-    def empty_ics_file(self, tmp_path):
-        """Create an empty ICS file."""
-        ics_content = """BEGIN:VCALENDAR
+EMPTY_ICS = """BEGIN:VCALENDAR
 VERSION:2.0
 PRODID:-//Test//Test//EN
 END:VCALENDAR
 """
-        ics_path = tmp_path / "empty.ics"
-        ics_path.write_text(ics_content)
-        return ics_path
+
+# Shared read-only input for the _analyze_patterns tests; slice what you need
+_PATTERN_EVENTS = [{"title": f"Event {i}"} for i in range(101)]
+
+_ICS_HEADER = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//Test//EN\n"
+_ICS_FOOTER = "END:VCALENDAR\n"
+
+
+def _ics_event(title, start, end, location=None):
+    """Render one VEVENT block."""
+    parts = ["BEGIN:VEVENT\n", f"SUMMARY:{title}\nDTSTART:{start}\nDTEND:{end}\n"]
+    if location is not None:
+        parts.append(f"LOCATION:{location}\n")
+    parts.append("END:VEVENT\n")
+    return "".join(parts)
+
+
+def _build_ics(events):
+    """Join VEVENT blocks into a calendar in one pass."""
+    return "".join([_ICS_HEADER, *events, _ICS_FOOTER])
+
+
+async def _write_calendars(calendars):
+    """Write {path: content} files concurrently and return the paths in order."""
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(path.write_text, content)
+            for path, content in calendars.items()
+        )
+    )
+    return list(calendars)
+
+
+@pytest.fixture(scope="session")
+def sample_ics_file(tmp_path_factory):
+    """Write the sample ICS calendar once per session; tests must only read it."""
+    ics_path = tmp_path_factory.mktemp("ics") / "calendar.ics"
+    ics_path.write_text(SAMPLE_ICS)
+    return ics_path
+
+
+@pytest.fixture(scope="session")
+def empty_ics_file(tmp_path_factory):
+    """Write an event-less ICS calendar once per session; tests must only read it."""
+    ics_path = tmp_path_factory.mktemp("ics") / "empty.ics"
+    ics_path.write_text(EMPTY_ICS)
+    return ics_path
+
+
+@pytest.fixture(scope="session")
+def calendar_processor():
+    """Create a CalendarProcessor shared by the session; tests must not mutate it."""
+    return CalendarProcessor()
+
+
+@pytest.mark.unit
+class TestCalendarProcessor:
+    """Test CalendarProcessor functionality."""
 
     @pytest.mark.asyncio
     async def test_process_valid_calendar(self, calendar_processor, sample_ics_file):
@@ -78,13 +125,9 @@ END:VCALENDAR
         assert "interests" in result.content
         assert result.metadata["file_type"] == ".ics"
 
-    @pytest.mark.asyncio
-    async def test_parse_ics_events(self, calendar_processor, sample_ics_file):
+    def test_parse_ics_events(self, calendar_processor):
         """Test parsing ICS events."""
-        with open(sample_ics_file, "r") as f:
-            ics_content = f.read()
-
-        events = calendar_processor._parse_ics_events(ics_content)
+        events = calendar_processor._parse_ics_events(SAMPLE_ICS)
 
         assert len(events) == 3
         assert events[0]["title"] == "Team Standup"
@@ -108,12 +151,29 @@ END:VCALENDAR
             ("DTSTART:20240115T090000", "20240115T090000"),
             ("DTSTART:20240115", "20240115"),
             ("DTEND;TZID=UTC:20240115T093000Z", "20240115T093000Z"),
+            ("DTSTART:2024-01-15T09:00:00Z", "2024-01-15T09:00:00Z"),
+            ("DTSTART:2024-01-15T09:00:00+00:00", "2024-01-15T09:00:00+00:00"),
         ]
 
         for line, expected in test_cases:
             result = calendar_processor._parse_datetime(line)
             assert result == expected
 
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "DTSTART:20240115T090000Z",
+            "DTSTART:20240115",
+            "DTSTART:2024-01-15T09:00:00Z",
+            "DTEND;TZID=UTC:2024-01-15T09:30:00+00:00",
+        ],
+    )
+    def test_parse_datetime_iso_fast_path(self, calendar_processor, line):
+        """Test parsed values are directly accepted by datetime.fromisoformat."""
+        result = calendar_processor._parse_datetime(line)
+
+        assert datetime.fromisoformat(result).date() == date(2024, 1, 15)
+
     def test_parse_datetime_invalid(self, calendar_processor):
         """Test datetime parsing with invalid format."""
         result = calendar_processor._parse_datetime("INVALID:LINE")
@@ -133,6 +193,31 @@ END:VCALENDAR
         assert start == "20240110T100000Z"
         assert end == "20240120T100000Z"
 
+    def test_get_date_range_skips_unparsed_dates(self, calendar_processor):
+        """Test date range ignores DTSTART/DTEND values that failed to parse."""
+        events = [
+            {"start": None, "end": "20240112T100000Z"},
+            {"start": "20240110T100000Z", "end": None},
+        ]
+
+        start, end = calendar_processor._get_date_range(events)
+
+        assert start == "20240110T100000Z"
+        assert end == "20240112T100000Z"
+
+    def test_get_date_range_mixed_formats(self, calendar_processor):
+        """Test date range orders basic and extended ISO values together."""
+        events = [
+            {"start": "20240101T090000Z"},
+            {"start": "2024-12-31T09:00:00Z"},
+            {"start": "2024-06-15T12:00:00Z", "end": "20240615T130000Z"},
+        ]
+
+        start, end = calendar_processor._get_date_range(events)
+
+        assert start == "20240101T090000Z"
+        assert end == "2024-12-31T09:00:00Z"
+
     def test_get_date_range_empty(self, calendar_processor):
         """Test date range with empty events."""
         start, end = calendar_processor._get_date_range([])
@@ -193,7 +278,7 @@ END:VCALENDAR
 
     def test_analyze_patterns(self, calendar_processor):
         """Test event pattern analysis."""
-        events = [{"title": f"Event {i}"} for i in range(75)]
+        events = _PATTERN_EVENTS[:75]
 
         patterns = calendar_processor._analyze_patterns(events)
 
@@ -204,23 +289,22 @@ END:VCALENDAR
         )  # 75 events is moderate (>50 but <100)
         assert "types" in patterns
 
-    def test_analyze_patterns_light_busy(self, calendar_processor):
-        """Test pattern analysis with light busy level."""
-        events = [{"title": f"Event {i}"} for i in range(10)]
-
-        patterns = calendar_processor._analyze_patterns(events)
-
-        assert patterns["busy_level"] == "light"
-
-    def test_analyze_patterns_moderate_busy(self, calendar_processor):
-        """Test pattern analysis with moderate busy level."""
-        events = [{"title": f"Event {i}"} for i in range(75)]
-
-        patterns = calendar_processor._analyze_patterns(events)
-
-        assert (
-            patterns["busy_level"] == "moderate"
-        )  # 75 events is moderate (>50 but <100)
+    @pytest.mark.parametrize(
+        "count,expected",
+        [
+            (10, "light"),
+            (50, "light"),
+            (51, "moderate"),
+            (75, "moderate"),
+            (100, "moderate"),
+            (101, "heavy"),
+        ],
+    )
+    def test_analyze_patterns_busy_level(self, calendar_processor, count, expected):
+        """Test busy level classification, including threshold boundaries."""
+        patterns = calendar_processor._analyze_patterns(_PATTERN_EVENTS[:count])
+
+        assert patterns["busy_level"] == expected
 
     def test_analyze_patterns_empty(self, calendar_processor):
         """Test pattern analysis with no events."""
@@ -276,42 +360,6 @@ END:VCALENDAR
 class TestCalendarProcessorIntegration:
     """Integration tests for CalendarProcessor with fixtures."""
 
-    @pytest.fixture
-    async def calendar_processor(self):
-        """Create a CalendarProcessor instance."""
-        return CalendarProcessor()
-
-    @pytest.fixture
-    def sample_ics_file(self, tmp_path):
-        """Create a sample ICS calendar file."""
-        ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Test//Test//EN
-BEGIN:VEVENT
-SUMMARY:Team Standup
-DESCRIPTION:Daily team synchronization
-DTSTART:20240115T090000Z
-DTEND:20240115T093000Z
-LOCATION:Conference Room A
-END:VEVENT
-BEGIN:VEVENT
-SUMMARY:Project Review
-DESCRIPTION:Monthly project status review
-DTSTART:20240115T140000Z
-DTEND:20240115T153000Z
-LOCATION:Virtual - Zoom
-END:VEVENT
-BEGIN:VEVENT
-SUMMARY:Coffee Meeting
-DTSTART:20240116T100000Z
-DTEND:20240116T110000Z
-END:VEVENT
-END:VCALENDAR
-"""
-        ics_path = tmp_path / "calendar.ics"
-        ics_path.write_text(ics_content)
-        return ics_path
-
     @pytest.mark.asyncio
     async def test_process_with_fixture_data(self):
         """Test processing with fixture data."""
@@ -323,15 +371,9 @@ END:VCALENDAR
 
         assert len(fixture_data["events"]) > 0
 
-    @pytest.mark.asyncio
-    async def test_event_structure_consistency(
-        self, calendar_processor, sample_ics_file
-    ):
+    def test_event_structure_consistency(self, calendar_processor):
         """Test that parsed events have consistent structure."""
-        with open(sample_ics_file, "r") as f:
-            ics_content = f.read()
-
-        events = calendar_processor._parse_ics_events(ics_content)
+        events = calendar_processor._parse_ics_events(SAMPLE_ICS)
 
         for event in events:
             assert isinstance(event, dict)
@@ -353,6 +395,49 @@ END:VCALENDAR
         assert "description" in events[0]
         assert events[0]["description"] == "This is a test description"
 
+    def test_parse_ics_crlf_and_parameters(self, calendar_processor):
+        """Test parsing CRLF line endings and parameterized DTSTART/DTEND."""
+        ics_content = (
+            "BEGIN:VCALENDAR\r\n"
+            "BEGIN:VEVENT\r\n"
+            "SUMMARY:Team Sync  \r\n"
+            "DTSTART;TZID=America/Santiago:20240115T100000\r\n"
+            "DTEND;VALUE=DATE:20240116\r\n"
+            "LOCATION:Room 4\r\n"
+            "END:VEVENT\r\n"
+            "BEGIN:VEVENT\r\n"
+            "END:VEVENT\r\n"
+            "END:VCALENDAR\r\n"
+        )
+        events = calendar_processor._parse_ics_events(ics_content)
+
+        assert events == [
+            {
+                "title": "Team Sync",
+                "start": "20240115T100000",
+                "end": "20240116",
+                "location": "Room 4",
+            }
+        ]
+
+    @pytest.mark.perf
+    @pytest.mark.skipif(
+        os.environ.get("BENCH") != "1", reason="benchmark; set BENCH=1 to run"
+    )
+    def test_parse_ics_events_large_calendar_time_budget(self, calendar_processor):
+        """Test a 10k-event calendar parses within the compiled-regex budget."""
+        event = _ics_event(
+            "Team Standup", "20240115T090000Z", "20240115T093000Z", "Room A"
+        )
+        ics_content = _build_ics([event] * 10_000)
+
+        start = time.perf_counter()
+        events = calendar_processor._parse_ics_events(ics_content)
+        elapsed = time.perf_counter() - start
+
+        assert len(events) == 10_000
+        assert elapsed < 0.5
+
 
 @pytest.mark.unit
 class TestCalendarProcessorBatch:
@@ -363,58 +448,20 @@ class TestCalendarProcessorBatch:
         """Create a CalendarProcessor with batch capabilities."""
         return CalendarProcessor(max_concurrent=2)
 
-    @pytest.fixture
-    def sample_ics_file(self, tmp_path):
-        """Create a sample ICS calendar file."""
-        ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Test//Test//EN
-BEGIN:VEVENT
-SUMMARY:Team Standup
-DESCRIPTION:Daily team synchronization
-DTSTART:20240115T090000Z
-DTEND:20240115T093000Z
-LOCATION:Conference Room A
-END:VEVENT
-BEGIN:VEVENT
-SUMMARY:Project Review
-DESCRIPTION:Monthly project status review
-DTSTART:20240115T140000Z
-DTEND:20240115T153000Z
-LOCATION:Virtual - Zoom
-END:VEVENT
-BEGIN:VEVENT
-SUMMARY:Coffee Meeting
-DTSTART:20240116T100000Z
-DTEND:20240116T110000Z
-END:VEVENT
-END:VCALENDAR
-"""
-        ics_path = tmp_path / "calendar.ics"
-        ics_path.write_text(ics_content)
-        return ics_path
-
     @pytest.mark.asyncio
     async def test_process_batch_multiple_files(
         self, calendar_processor_batch, tmp_path
     ):
         """Test batch processing of multiple calendar files."""
         # Create multiple test ICS files
-        ics_files = []
+        calendars = {}
         for i in range(3):
-            ics_content = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Test//Test//EN
-BEGIN:VEVENT
-SUMMARY:Event {i}
-DTSTART:202401{10 + i}T100000Z
-DTEND:202401{10 + i}T110000Z
-END:VEVENT
-END:VCALENDAR
-"""
-            ics_path = tmp_path / f"calendar_{i}.ics"
-            ics_path.write_text(ics_content)
-            ics_files.append(ics_path)
+            day = f"202401{10 + i}"
+            ics_content = _build_ics(
+                [_ics_event(f"Event {i}", f"{day}T100000Z", f"{day}T110000Z")]
+            )
+            calendars[tmp_path / f"calendar_{i}.ics"] = ics_content
+        ics_files = await _write_calendars(calendars)
 
         # Process batch
         results = await calendar_processor_batch.process_batch(ics_files)
@@ -467,21 +514,14 @@ END:VCALENDAR
         processor = CalendarProcessor(max_concurrent=2)
 
         # Create multiple calendar files
-        ics_files = []
+        calendars = {}
         for i in range(5):
-            ics_content = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Test//Test//EN
-BEGIN:VEVENT
-SUMMARY:Event {i}
-DTSTART:202401{10 + i}T100000Z
-DTEND:202401{10 + i}T110000Z
-END:VEVENT
-END:VCALENDAR
-"""
-            ics_path = tmp_path / f"calendar_{i}.ics"
-            ics_path.write_text(ics_content)
-            ics_files.append(ics_path)
+            day = f"202401{10 + i}"
+            ics_content = _build_ics(
+                [_ics_event(f"Event {i}", f"{day}T100000Z", f"{day}T110000Z")]
+            )
+            calendars[tmp_path / f"calendar_{i}.ics"] = ics_content
+        ics_files = await _write_calendars(calendars)
 
         # Process batch
         results = await processor.process_batch(ics_files)
@@ -518,27 +558,19 @@ END:VCALENDAR
         processor = CalendarProcessor(max_concurrent=3)
 
         # Create test calendars
-        ics_files = []
+        calendars = {}
         for i in range(3):
-            ics_content = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Test//Test//EN
-BEGIN:VEVENT
-SUMMARY:Meeting {i}
-DTSTART:202401{10 + i}T090000Z
-DTEND:202401{10 + i}T093000Z
-LOCATION:Room {i}
-END:VEVENT
-BEGIN:VEVENT
-SUMMARY:Standup {i}
-DTSTART:202401{10 + i}T140000Z
-DTEND:202401{10 + i}T150000Z
-END:VEVENT
-END:VCALENDAR
-"""
-            ics_path = tmp_path / f"cal_{i}.ics"
-            ics_path.write_text(ics_content)
-            ics_files.append(ics_path)
+            day = f"202401{10 + i}"
+            ics_content = _build_ics(
+                [
+                    _ics_event(
+                        f"Meeting {i}", f"{day}T090000Z", f"{day}T093000Z", f"Room {i}"
+                    ),
+                    _ics_event(f"Standup {i}", f"{day}T140000Z", f"{day}T150000Z"),
+                ]
+            )
+            calendars[tmp_path / f"cal_{i}.ics"] = ics_content
+        ics_files = await _write_calendars(calendars)
 
         # Process batch
         results = await processor.process_batch(ics_files)
@@ -601,21 +633,19 @@ END:VCALENDAR
     async def test_batch_results_independence(self, calendar_processor_batch, tmp_path):
         """Test that batch results are independent and don't interfere with each other."""
         # Create files with different event counts
-        files = []
+        calendars = {}
         for count in [1, 3, 5]:
-            ics_content = "BEGIN:VCALENDAR\nVERSION:2.0\nPRODID:-//Test//Test//EN\n"
-            for i in range(count):
-                ics_content += f"""BEGIN:VEVENT
-SUMMARY:Event {i}
-DTSTART:202401{10 + i:02d}T{9 + i:02d}0000Z
-DTEND:202401{10 + i:02d}T{10 + i:02d}0000Z
-END:VEVENT
-"""
-            ics_content += "END:VCALENDAR"
-
-            ics_path = tmp_path / f"cal_{count}.ics"
-            ics_path.write_text(ics_content)
-            files.append(ics_path)
+            ics_content = _build_ics(
+                _ics_event(
+                    f"Event {i}",
+                    f"202401{10 + i:02d}T{9 + i:02d}0000Z",
+                    f"202401{10 + i:02d}T{10 + i:02d}0000Z",
+                )
+                for i in range(count)
+            )
+
+            calendars[tmp_path / f"cal_{count}.ics"] = ics_content
+        files = await _write_calendars(calendars)
 
         results = await calendar_processor_batch.process_batch(files)
 
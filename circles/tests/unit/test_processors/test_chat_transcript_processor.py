@@ -24,9 +24,9 @@ class TestChatTranscriptProcessor:
         """Create a ChatTranscriptProcessor instance."""
         return ChatTranscriptProcessor()
 
-    @pytest.fixture
-    def sample_json_transcript_file(self, tmp_path):
-        """Create a sample JSON transcript file."""
+    @pytest.fixture(scope="session")
+    def sample_json_transcript_file(self, tmp_path_factory):
+        """Write a sample JSON transcript once per session; tests must only read it."""
         transcript_data = {
             "messages": [
                 {
@@ -56,13 +56,13 @@ class TestChatTranscriptProcessor:
                 "channel": "engineering",
             },
         }
-        json_path = tmp_path / "transcript.json"
+        json_path = tmp_path_factory.mktemp("transcripts") / "transcript.json"
         json_path.write_text(json.dumps(transcript_data))
         return json_path
 
-    @pytest.fixture
-    def sample_text_transcript_file(self, tmp_path):
-        """Create a sample text transcript file."""
+    @pytest.fixture(scope="session")
+    def sample_text_transcript_file(self, tmp_path_factory):
+        """Write a sample text transcript once per session; tests must only read it."""
         transcript_content = """john: Hi everyone
 jane: Hello! How are you?
 bob: Doing well, thanks!
@@ -70,19 +70,19 @@ john: Great, let's start the meeting
 jane: Sounds good
 bob: Ready when you are
 """
-        text_path = tmp_path / "transcript.txt"
+        text_path = tmp_path_factory.mktemp("transcripts") / "transcript.txt"
         text_path.write_text(transcript_content)
         return text_path
 
-    @pytest.fixture
-    def large_json_transcript_file(self, tmp_path):
-        """Create a large JSON transcript for chunking tests."""
+    @pytest.fixture(scope="session")
+    def large_json_transcript_file(self, tmp_path_factory):
+        """Write a 250-message JSON transcript once per session for chunking tests."""
         messages = [
             {"sender": f"user{i % 3}", "text": f"Message {i}"}
             for i in range(250)  # More than 2 chunks
         ]
         transcript_data = {"messages": messages}
-        json_path = tmp_path / "large_transcript.json"
+        json_path = tmp_path_factory.mktemp("transcripts") / "large_transcript.json"
         json_path.write_text(json.dumps(transcript_data))
         return json_path
 
@@ -114,6 +114,24 @@ bob: Ready when you are
         assert result.metadata["file_type"] == ".txt"
         assert result.metadata["format"] == "text"
 
+    @pytest.mark.parametrize("newline", [b"\r", b"\r\n"])
+    @pytest.mark.asyncio
+    async def test_process_text_transcript_cr_line_endings(
+        self, transcript_processor, tmp_path, newline
+    ):
+        """Test CR and CRLF line endings split into separate messages."""
+        text_path = tmp_path / "transcript_cr.txt"
+        text_path.write_bytes(newline.join([b"a: hi", b"b: yo", b""]))
+
+        result = await transcript_processor.process(text_path)
+
+        assert result.content["participants"] == ["a", "b"]
+        assert result.content["message_count"] == 2
+        assert result.content["splits"][0]["messages"] == [
+            {"sender": "a", "text": "hi"},
+            {"sender": "b", "text": "yo"},
+        ]
+
     @pytest.mark.asyncio
     async def test_parse_json_transcript_list(self, transcript_processor):
         """Test parsing JSON transcript as list of messages."""
@@ -148,6 +166,17 @@ bob: Ready when you are
         assert len(messages) == 2
         assert metadata.get("channel") == "general"
 
+    def test_parse_json_transcript_bytes(self, transcript_processor):
+        """Test parsing a JSON transcript passed as raw UTF-8 bytes."""
+        json_content = json.dumps(
+            {"messages": [{"sender": "josé", "text": "¡Hola!"}]}, ensure_ascii=False
+        ).encode("utf-8")
+
+        messages, metadata = transcript_processor._parse_json_transcript(json_content)
+
+        assert messages == [{"sender": "josé", "text": "¡Hola!"}]
+        assert metadata == {"date_start": None, "date_end": None}
+
     @pytest.mark.asyncio
     async def test_parse_json_transcript_invalid(self, transcript_processor):
         """Test parsing invalid JSON transcript."""
@@ -181,7 +210,7 @@ jane: Hi"""
         # Should only capture messages with colons
         assert len(messages) == 2
 
-    def test_extract_participants(self, transcript_processor):
+    def test_count_senders_participants(self, transcript_processor):
         """Test extracting unique participants."""
         messages = [
             {"sender": "john", "text": "Hello"},
@@ -190,17 +219,30 @@ jane: Hi"""
             {"sender": "bob", "text": "Fine"},
         ]
 
-        participants = transcript_processor._extract_participants(messages)
+        participants = list(transcript_processor._count_senders(messages))
 
         assert set(participants) == {"john", "jane", "bob"}
 
-    def test_extract_participants_empty(self, transcript_processor):
+    def test_count_senders_first_seen_order(self, transcript_processor):
+        """Test participants keep first-appearance order without duplicates."""
+        messages = [
+            {"sender": "bob", "text": "First"},
+            {"sender": "alice", "text": "Second"},
+            {"sender": "bob", "text": "Third"},
+            {"sender": "", "text": "Anonymous"},
+        ]
+
+        participants = list(transcript_processor._count_senders(messages))
+
+        assert participants == ["bob", "alice", ""]
+
+    def test_count_senders_empty(self, transcript_processor):
         """Test extracting participants from empty messages."""
-        participants = transcript_processor._extract_participants([])
+        participants = list(transcript_processor._count_senders([]))
 
         assert participants == []
 
-    def test_extract_participants_malformed(self, transcript_processor):
+    def test_count_senders_malformed(self, transcript_processor):
         """Test extracting participants from malformed messages."""
         messages = [
             {"sender": "john", "text": "Hello"},
@@ -209,7 +251,7 @@ jane: Hi"""
             {"sender": "jane", "text": "Hi"},
         ]
 
-        participants = transcript_processor._extract_participants(messages)
+        participants = list(transcript_processor._count_senders(messages))
 
         assert "john" in participants
         assert "jane" in participants
@@ -232,6 +274,22 @@ jane: Hi"""
         assert analysis["participant_activity"]["jane"] == 2
         assert analysis["participant_activity"]["bob"] == 1
 
+    def test_analyze_conversation_reuses_sender_counts(self, transcript_processor):
+        """Test analysis with sender counts precomputed by _count_senders."""
+        messages = [
+            {"sender": "john", "text": "Hi"},
+            {"text": "No sender"},
+            {"sender": "jane", "text": "Hello"},
+            {"sender": "john", "text": "How are you?"},
+        ]
+        sender_counts = transcript_processor._count_senders(messages)
+
+        analysis = transcript_processor._analyze_conversation(messages, sender_counts)
+
+        assert list(sender_counts) == ["john", "jane"]
+        assert analysis == transcript_processor._analyze_conversation(messages)
+        assert analysis["participant_activity"] == {"john": 2, "jane": 1}
+
     def test_analyze_conversation_empty(self, transcript_processor):
         """Test analyzing empty conversation."""
         analysis = transcript_processor._analyze_conversation([])
@@ -385,7 +443,7 @@ class TestChatTranscriptProcessorIntegration:
             {"sender": "JOHN", "text": "Hey"},
         ]
 
-        participants = transcript_processor._extract_participants(messages)
+        participants = list(transcript_processor._count_senders(messages))
 
         # Should extract all variants since they're technically different
         assert len(participants) == 3
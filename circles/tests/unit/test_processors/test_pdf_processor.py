@@ -4,7 +4,9 @@ Unit tests for PDFProcessor.
 Tests PDF document processing with text extraction and content analysis.
 """
 
+import asyncio
 import logging
+from unittest.mock import patch
 
 import pytest
 
@@ -168,6 +170,13 @@ This architecture supports both current requirements and future scaling needs.
         assert result["document_type"] == "whitepaper"
         assert result["metadata"]["author"] == "Jane Doe"
 
+    def test_extract_json_with_braces_in_trailing_text(self, pdf_processor):
+        """Test JSON extraction ignores braces in text after the object."""
+        response = 'Result: {"document_type": "memo"} (schema: {type})'
+        result = pdf_processor._extract_json_from_response(response)
+
+        assert result == {"document_type": "memo"}
+
     def test_extract_json_fallback_to_none(self, pdf_processor):
         """Test JSON extraction returns None for invalid JSON."""
         response = "This is not JSON at all"
@@ -222,6 +231,13 @@ This architecture supports both current requirements and future scaling needs.
         assert "HTML" in text
         assert "<" not in text
 
+    def test_markdown_to_text_plain_prose_unchanged(self, pdf_processor):
+        """Test text without markdown markers only loses surrounding whitespace."""
+        markdown = "  Plain paragraph, no markup at all.\nSecond line.  "
+        text = pdf_processor._markdown_to_text(markdown)
+
+        assert text == "Plain paragraph, no markup at all.\nSecond line."
+
     def test_fallback_analysis(self, pdf_processor):
         """Test fallback analysis has correct structure."""
         fallback = pdf_processor._get_fallback_analysis()
@@ -327,6 +343,27 @@ This architecture supports both current requirements and future scaling needs.
         assert processor.max_concurrent == 2
         assert processor.semaphore._value == 2
 
+    @pytest.mark.asyncio
+    async def test_process_batch_overlaps_up_to_max_concurrent(self, tmp_path):
+        """Test batch files are processed concurrently, capped by the semaphore."""
+        processor = PDFProcessor(max_concurrent=2)
+        pdf_files = [tmp_path / f"document_{i}.pdf" for i in range(5)]
+        in_flight = peak = 0
+
+        async def fake_process(file_path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleProcessorResult(content={}, metadata={})
+
+        with patch.object(processor, "process", side_effect=fake_process):
+            results = await processor.process_batch(pdf_files)
+
+        assert len(results) == 5
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_process_batch_empty_list(self, pdf_processor):
         """Test batch processing with empty file list."""
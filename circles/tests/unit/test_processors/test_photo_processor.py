@@ -98,6 +98,16 @@ class TestPhotoProcessor:
             media_type = photo_processor._get_media_type(photo_path)
             assert media_type.startswith("image/")
 
+    def test_read_base64(self, photo_processor, tmp_path):
+        """Test image bytes are base64-encoded and sized in one read."""
+        image_path = tmp_path / "pixel.png"
+        image_path.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        encoded, file_size = photo_processor._read_base64(image_path)
+
+        assert base64.standard_b64decode(encoded) == b"\x89PNG\r\n\x1a\n"
+        assert file_size == 8
+
     def test_get_media_type_known_formats(self, photo_processor):
         """Test media type detection for known formats."""
         test_cases = {
@@ -146,6 +156,45 @@ class TestPhotoProcessor:
         assert "objects" in analysis
         assert analysis["objects"] == ["obj1", "obj2"]
 
+    @pytest.mark.asyncio
+    async def test_analyze_image_deeply_nested_json(self, photo_processor):
+        """Test a bare JSON response nested three levels deep is decoded whole."""
+        response_text = (
+            '{"caption": "Street", "analysis": {"setting": {"lighting": "dusk"}}}'
+        )
+
+        with patch.object(
+            photo_processor.client.messages,
+            "create",
+            return_value=MagicMock(content=[MagicMock(text=response_text)]),
+        ):
+            caption, analysis = await photo_processor._analyze_image(
+                base64.b64encode(b"dummy").decode(), "image/jpeg"
+            )
+
+        assert caption == "Street"
+        assert analysis == {"setting": {"lighting": "dusk"}}
+
+    @pytest.mark.asyncio
+    async def test_analyze_image_json_in_prose(self, photo_processor):
+        """Test a JSON object wrapped in explanatory text is still extracted."""
+        response_text = (
+            'Here is the analysis:\n{"caption": "Beach", "analysis": {"sky": "clear"}}'
+            "\nLet me know if you need more."
+        )
+
+        with patch.object(
+            photo_processor.client.messages,
+            "create",
+            return_value=MagicMock(content=[MagicMock(text=response_text)]),
+        ):
+            caption, analysis = await photo_processor._analyze_image(
+                base64.b64encode(b"dummy").decode(), "image/jpeg"
+            )
+
+        assert caption == "Beach"
+        assert analysis == {"sky": "clear"}
+
     @pytest.mark.asyncio
     async def test_analyze_image_malformed_json(self, photo_processor):
         """Test handling of malformed JSON from Claude Vision."""
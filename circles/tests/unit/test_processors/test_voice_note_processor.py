@@ -4,9 +4,16 @@ Unit tests for VoiceNoteProcessor.
 Tests audio transcription with OpenAI Whisper API mocking.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import io
+import math
+import struct
+import wave
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from src.etl.processors import voice_note_processor as voice_note_processor_module
 from src.etl.processors.voice_note_processor import (
     SimpleProcessorResult,
     VoiceNoteProcessor,
@@ -25,9 +32,31 @@ class TestVoiceNoteProcessor:
         return VoiceNoteProcessor()
 
     @pytest.fixture
-    def sample_audio_file(self, tmp_path, sample_audio_bytes):
+    def tone_audio_bytes(self):
+        """Provide a 1 second 440 Hz tone WAV so the silence check lets it through."""
+        frames = b"".join(
+            struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / 16000)))
+            for i in range(16000)
+        )
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, "wb") as wav_file:
+            wav_file.setnchannels(1)  # Mono
+            wav_file.setsampwidth(2)  # 16-bit
+            wav_file.setframerate(16000)
+            wav_file.writeframes(frames)
+        return wav_buffer.getvalue()
+
+    @pytest.fixture
+    def sample_audio_file(self, tmp_path, tone_audio_bytes):
         """Create a temporary audio file."""
         audio_path = tmp_path / "test_audio.wav"
+        audio_path.write_bytes(tone_audio_bytes)
+        return audio_path
+
+    @pytest.fixture
+    def silent_audio_file(self, tmp_path, sample_audio_bytes):
+        """Create a temporary audio file containing only silence."""
+        audio_path = tmp_path / "silent_audio.wav"
         audio_path.write_bytes(sample_audio_bytes)
         return audio_path
 
@@ -37,6 +66,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text="This is a test transcription", language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -59,6 +89,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text=transcription_text, language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -76,6 +107,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text=transcription_text, language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -94,6 +126,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text=transcription_text, language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -112,6 +145,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text=transcription_text, language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -190,6 +224,7 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             side_effect=OpenAIError("API Error"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -208,27 +243,20 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text="Bonjour, comment allez-vous?", language="fr"),
         ):
             result = await voice_processor.process(sample_audio_file)
 
         assert result.content["language"] == "fr"
 
-    @pytest.mark.asyncio
-    async def test_get_audio_duration(self, voice_processor, sample_audio_file):
-        """Test audio duration extraction."""
-        # Try to get duration - may fail if pydub not installed
-        duration = await voice_processor._get_audio_duration(sample_audio_file)
-
-        assert isinstance(duration, float)
-        assert duration >= 0.0
-
     @pytest.mark.asyncio
     async def test_processor_result_structure(self, voice_processor, sample_audio_file):
         """Test that processor result has correct structure."""
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text="Test transcription", language="en"),
         ):
             result = await voice_processor.process(sample_audio_file)
@@ -260,12 +288,181 @@ class TestVoiceNoteProcessor:
         with patch.object(
             voice_processor.client.audio.transcriptions,
             "create",
+            new_callable=AsyncMock,
             return_value=MagicMock(text="Test", language=None),
         ):
             result = await voice_processor.process(sample_audio_file)
 
         assert result.content["language"] == "unknown"
 
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_awaits_async_client(
+        self, voice_processor, sample_audio_file
+    ):
+        """Test that the Whisper call is awaited directly, not run in a thread."""
+        with (
+            patch.object(
+                voice_processor.client.audio.transcriptions,
+                "create",
+                new_callable=AsyncMock,
+                return_value=MagicMock(text="Async transcription", language="en"),
+            ) as mock_create,
+            patch(
+                "src.etl.processors.voice_note_processor.asyncio.to_thread",
+                wraps=asyncio.to_thread,
+            ) as mock_to_thread,
+        ):
+            result = await voice_processor._transcribe_audio(sample_audio_file)
+
+        mock_create.assert_awaited_once()
+        # Only the file open goes through a thread, never the API call
+        assert all(
+            call.args[0] is not mock_create for call in mock_to_thread.call_args_list
+        )
+        assert result["text"] == "Async transcription"
+
+    @pytest.mark.parametrize(
+        "language,expected",
+        [
+            ("english", "en"),
+            ("luxembourgish", "lb"),
+            ("haitian creole", "ht"),
+            ("fr", "fr"),
+            ("hawaiian", "unknown"),
+            (None, "unknown"),
+        ],
+    )
+    def test_language_code(self, voice_processor, language, expected):
+        """Test Whisper language names map to ISO-639-1 codes."""
+        assert voice_processor._language_code(language) == expected
+
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_verbose_json_segments(
+        self, voice_processor, sample_audio_file
+    ):
+        """Test that segments and duration come from the verbose_json response."""
+        # Whisper's duration must win over the locally probed one
+        transcript = SimpleNamespace(
+            text="Hello world",
+            language="english",
+            duration=2.0,
+            segments=[
+                SimpleNamespace(text="Hello", start=0.0, end=1.0),
+                SimpleNamespace(text="world", start=1.5, end=2.0),
+            ],
+        )
+
+        with (
+            patch.object(
+                voice_processor.client.audio.transcriptions,
+                "create",
+                new_callable=AsyncMock,
+                return_value=transcript,
+            ) as mock_create,
+            patch.object(
+                voice_processor, "_probe_audio", return_value=(9.9, False)
+            ),
+        ):
+            result = await voice_processor.process(sample_audio_file)
+
+        assert mock_create.await_args.kwargs["response_format"] == "verbose_json"
+        assert result.content["segments"] == [
+            {"text": "Hello", "start": 0.0, "end": 1.0},
+            {"text": "world", "start": 1.5, "end": 2.0},
+        ]
+        assert result.content["language"] == "en"
+        assert result.metadata["duration_seconds"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_uses_configured_model(
+        self, voice_processor, sample_audio_file
+    ):
+        """Test that Whisper is called with the model the cache key is built from."""
+        transcript = SimpleNamespace(text="Hello", language="en", duration=1.0)
+
+        with (
+            patch.object(
+                voice_processor.client.audio.transcriptions,
+                "create",
+                new_callable=AsyncMock,
+                return_value=transcript,
+            ) as mock_create,
+            patch.object(
+                voice_note_processor_module,
+                "get_settings",
+                return_value=SimpleNamespace(whisper_model="whisper-custom"),
+            ),
+        ):
+            await voice_processor._transcribe_audio(sample_audio_file)
+
+        assert mock_create.await_args.kwargs["model"] == "whisper-custom"
+
+    @pytest.mark.asyncio
+    async def test_transcribe_audio_streams_file_handle(
+        self, voice_processor, sample_audio_file
+    ):
+        """Test that Whisper gets the open file rather than a buffered copy."""
+        transcript = SimpleNamespace(text="Hello", language="en", duration=1.0)
+
+        with patch.object(
+            voice_processor.client.audio.transcriptions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=transcript,
+        ) as mock_create:
+            await voice_processor._transcribe_audio(sample_audio_file)
+
+        uploaded = mock_create.await_args.kwargs["file"]
+        assert uploaded.name == str(sample_audio_file)
+        assert uploaded.closed
+
+    @pytest.mark.asyncio
+    async def test_silent_audio_skips_whisper(self, voice_processor, silent_audio_file):
+        """Test that silent recordings never reach the Whisper API."""
+        with patch.object(
+            voice_processor.client.audio.transcriptions,
+            "create",
+            new_callable=AsyncMock,
+        ) as mock_create:
+            result = await voice_processor.process(silent_audio_file)
+
+        mock_create.assert_not_awaited()
+        assert result.content["transcription"] == ""
+        assert result.content["segments"] == []
+        assert result.metadata["duration_seconds"] == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_undecodable_audio_still_transcribed(self, voice_processor, tmp_path):
+        """Test that audio the local decoder can't read is sent to Whisper."""
+        audio_path = tmp_path / "note.wav"
+        audio_path.write_bytes(b"not really audio")
+
+        with patch.object(
+            voice_processor.client.audio.transcriptions,
+            "create",
+            new_callable=AsyncMock,
+            return_value=MagicMock(text="Still transcribed", language="en"),
+        ) as mock_create:
+            result = await voice_processor.process(audio_path)
+
+        mock_create.assert_awaited_once()
+        assert result.content["transcription"] == "Still transcribed"
+
+    @pytest.mark.asyncio
+    async def test_client_shared_across_processors(self, monkeypatch):
+        """Test that processors on one event loop reuse a single client."""
+        monkeypatch.setattr(voice_note_processor_module, "_whisper_client", None)
+        monkeypatch.setattr(voice_note_processor_module, "_whisper_client_loop", None)
+
+        with patch(
+            "src.etl.processors.voice_note_processor.AsyncOpenAI"
+        ) as mock_async_openai:
+            first = VoiceNoteProcessor()
+            second = VoiceNoteProcessor()
+
+        mock_async_openai.assert_called_once()
+        assert first.client is second.client
+
 
 @pytest.mark.unit
 class TestVoiceNoteProcessorIntegration:
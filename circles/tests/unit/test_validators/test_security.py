@@ -0,0 +1,64 @@
+"""
+Unit tests for SecureFileValidator.
+
+Tests magic byte detection against the indexed signature table.
+"""
+
+import pytest
+
+from src.etl.core import SecureFileValidator
+
+
+@pytest.mark.unit
+class TestDetectMagicBytes:
+    """Test SecureFileValidator.detect_magic_bytes."""
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (b"%PDF-1.7\n", "application/pdf"),
+            (b"\x50\x4b\x03\x04rest", "application/zip"),
+            (b"\xff\xd8\xff\xe0JFIF", "image/jpeg"),
+            (b"\x89PNG\r\n\x1a\n", "image/png"),
+            (b"GIF87a....", "image/gif"),
+            (b"GIF89a....", "image/gif"),
+        ],
+    )
+    def test_known_signatures(self, content, expected):
+        """Test that every registered signature is detected."""
+        assert SecureFileValidator.detect_magic_bytes(content) == expected
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"", b"GI", b"GIF90a", b"ID3\x04", b"dummy audio content"],
+    )
+    def test_unknown_content(self, content):
+        """Test that short or unregistered content falls back to octet-stream."""
+        assert (
+            SecureFileValidator.detect_magic_bytes(content)
+            == "application/octet-stream"
+        )
+
+    def test_index_covers_every_signature(self):
+        """Test that the prefix index holds every MAGIC_BYTES entry."""
+        indexed = {
+            magic
+            for candidates in SecureFileValidator._MAGIC_INDEX.values()
+            for magic, _ in candidates
+        }
+        assert indexed == set(SecureFileValidator.MAGIC_BYTES)
+
+
+@pytest.mark.unit
+class TestAllowedExtensions:
+    """Test SecureFileValidator.ALLOWED_EXTENSIONS."""
+
+    def test_extension_sets_are_frozen(self):
+        """Test that whitelists are immutable frozensets built once."""
+        for extensions in SecureFileValidator.ALLOWED_EXTENSIONS.values():
+            assert type(extensions) is frozenset
+
+    def test_validate_extension_case_insensitive(self):
+        """Test that extension matching ignores case."""
+        assert SecureFileValidator.validate_extension("NOTE.MP3", "audio").is_valid
+        assert not SecureFileValidator.validate_extension("note.txt", "audio").is_valid